@@ -17,8 +17,10 @@ CREATE TABLE IF NOT EXISTS dish_image_query_prod_dev (
 -- Create index on id for faster lookups
 CREATE INDEX IF NOT EXISTS idx_dish_image_query_prod_dev_id ON dish_image_query_prod_dev(id);
 
--- Create index on user_id for faster user-based queries
-CREATE INDEX IF NOT EXISTS idx_dish_image_query_prod_dev_user_id ON dish_image_query_prod_dev(user_id);
+-- Per-user lookups and "my dishes, newest first" history pages (keyset on
+-- (created_at, id)) are both served by one composite index as a range scan.
+CREATE INDEX IF NOT EXISTS idx_dish_image_query_prod_dev_user_created_id
+    ON dish_image_query_prod_dev (user_id, created_at DESC, id DESC);
 
 -- One row per (user, day, slot). Re-uploading a slot now REPLACES the prior row
 -- via replace_slot_atomic; this partial unique index is the DB-level guard
@@ -0,0 +1,61 @@
+-- =============================================================================
+-- Migration: 261015_dish_query_results_jsonb.sql
+--
+-- Converts dish_image_query_prod_dev.result_openai / result_gemini to JSONB.
+--
+-- create_tables.sql has always declared both columns JSONB, but tables
+-- bootstrapped through `Base.metadata.create_all` (src/main.py) got plain
+-- `json` from the old ORM mapping (Column(JSON)). `json` is stored as text
+-- and reparsed on every read, and it rejects the jsonb operators used by
+-- the partial metadata write in src/crud/dish_query_iterations.py
+-- (jsonb_set / #> / ||). The ORM now maps these columns to JSONB on
+-- Postgres, so every environment converges on the same type.
+--
+-- No GIN index is added: nothing filters on keys inside these blobs
+-- (every read is by id, user_id or date), so an index would only slow
+-- the per-phase writes.
+--
+-- IDEMPOTENCY GATE: each ALTER runs only while the column is still `json`.
+-- Running this script twice is a no-op on the second run.
+-- =============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'dish_image_query_prod_dev'
+          AND column_name = 'result_openai'
+          AND data_type = 'json'
+    ) THEN
+        ALTER TABLE dish_image_query_prod_dev
+            ALTER COLUMN result_openai TYPE jsonb USING result_openai::jsonb;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'dish_image_query_prod_dev'
+          AND column_name = 'result_gemini'
+          AND data_type = 'json'
+    ) THEN
+        ALTER TABLE dish_image_query_prod_dev
+            ALTER COLUMN result_gemini TYPE jsonb USING result_gemini::jsonb;
+    END IF;
+END $$;
+
+COMMIT;
+
+-- =============================================================================
+-- Verification query (run manually after the COMMIT above):
+-- Expect two rows, both with data_type = 'jsonb'.
+-- =============================================================================
+--
+-- SELECT column_name, data_type
+-- FROM information_schema.columns
+-- WHERE table_name = 'dish_image_query_prod_dev'
+--   AND column_name IN ('result_openai', 'result_gemini');
+--
+-- =============================================================================
+-- End of migration 261015_dish_query_results_jsonb.sql
+-- =============================================================================
@@ -0,0 +1,44 @@
+-- =============================================================================
+-- Migration: 261015_dish_query_user_created_index.sql
+--
+-- Adds a composite (user_id, created_at DESC, id DESC) index on
+-- dish_image_query_prod_dev and drops the single-column user_id index it
+-- supersedes.
+--
+-- The per-user history (get_dish_image_queries_by_user and its summary
+-- variant in src/crud/dish_query_filters.py) pages newest-first on a
+-- (created_at, id) keyset cursor: `WHERE user_id = ? AND (created_at, id)
+-- < (?, ?) ORDER BY created_at DESC, id DESC`. With only the user_id
+-- index, Postgres fetches every row for the user and sorts; this index
+-- matches the cursor column for column, so each page is a direct range
+-- scan. It still serves every plain `user_id = ?` lookup (leading column),
+-- so keeping the old index would only cost writes.
+--
+-- CONCURRENTLY avoids blocking uploads while the index builds, which also
+-- means this script must NOT run inside a transaction block (no BEGIN /
+-- COMMIT here; run with psql's default autocommit).
+--
+-- IDEMPOTENCY GATE: IF NOT EXISTS / IF EXISTS on every statement.
+-- =============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_dish_image_query_prod_dev_user_created_id
+    ON dish_image_query_prod_dev (user_id, created_at DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_dish_image_query_prod_dev_user_id;
+
+-- =============================================================================
+-- Verification query (run manually after the statements above):
+-- Expect an "Index Scan using idx_dish_image_query_prod_dev_user_created_id"
+-- with no separate Sort node.
+-- =============================================================================
+--
+-- EXPLAIN SELECT id, image_url, dish_position, created_at, target_date
+-- FROM dish_image_query_prod_dev
+-- WHERE user_id = 1
+--   AND (created_at, id) < ('2026-10-15 12:00:00', 1000)
+-- ORDER BY created_at DESC, id DESC
+-- LIMIT 50;
+--
+-- =============================================================================
+-- End of migration 261015_dish_query_user_created_index.sql
+-- =============================================================================
@@ -0,0 +1,46 @@
+"""
+Conditional-GET helper for small per-user JSON endpoints.
+
+Used by:
+  - src/api/dashboard.py   (calendar month view)
+  - src/api/login.py       (GET /api/login/session)
+
+Both endpoints are re-fetched on every page navigation but rarely change
+between fetches. Stamping a content-hash `ETag` lets the browser revalidate
+with `If-None-Match` and receive an empty 304 instead of the full body.
+`Cache-Control: private, no-cache` keeps shared caches out (the payload is
+per-user) and forces revalidation so a new upload shows up immediately.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response
+
+from src.api._json_response import FastJSONResponse
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(content: Any) -> str:
+    """Return a strong ETag for a JSON-serializable payload."""
+    body = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+
+
+def etag_json_response(request: Request, content: Any) -> Response:
+    """
+    Build a FastJSONResponse carrying `ETag` + `Cache-Control`, or a bare 304
+    when the client's `If-None-Match` already matches the payload.
+    """
+    etag = compute_etag(content)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    return FastJSONResponse(content=content, headers=headers)
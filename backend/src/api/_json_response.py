@@ -0,0 +1,24 @@
+"""
+JSON response class shared by the API routers.
+
+Dish payloads carry the full `result_gemini` document (iterations,
+nutrition, personalization matches), so encoding the response body is
+real per-request work. `FastJSONResponse` renders with pydantic-core's
+Rust encoder instead of stdlib `json.dumps`. Output is compact UTF-8 JSON
+like Starlette's `JSONResponse`, with two differences: exponents are
+written without a `+` (`1e300`, not `1e+300`), which parses to the same
+value, and NaN / ±inf become `null` where Starlette raises ValueError.
+"""
+
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """`JSONResponse` rendered by `pydantic_core.to_json`."""
+
+    def render(self, content: Any) -> bytes:
+        # Never emit bare NaN / Infinity tokens: they are not valid JSON.
+        return pydantic_core.to_json(content, inf_nan_mode="null")
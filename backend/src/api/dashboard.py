@@ -9,9 +9,9 @@ import calendar
 import logging
 from datetime import datetime
 
-from fastapi import APIRouter, Request, Query, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request, Query, HTTPException, Response
 
+from src.api._http_cache import etag_json_response
 from src.auth import authenticate_user_from_request
 from src.crud.crud_food_image_query import get_calendar_data
 
@@ -26,7 +26,7 @@ async def dashboard(  # pylint: disable=too-many-locals
     request: Request,
     year: int = Query(None, description="Year to display"),
     month: int = Query(None, description="Month to display"),
-) -> JSONResponse:
+) -> Response:
     """
     Get dashboard calendar data with user's food analyses.
 
@@ -36,7 +36,8 @@ async def dashboard(  # pylint: disable=too-many-locals
         month (int): Month to display
 
     Returns:
-        JSONResponse: Calendar view data
+        Response: Calendar view data with an `ETag`; an empty 304 when the
+            client's `If-None-Match` already matches
 
     Raises:
         HTTPException: 401 if not authenticated
@@ -95,8 +96,9 @@ async def dashboard(  # pylint: disable=too-many-locals
 
     month_name = calendar.month_name[display_month]
 
-    return JSONResponse(
-        content={
+    return etag_json_response(
+        request,
+        {
             "calendar_data": calendar_data,
             "month_name": month_name,
             "display_year": display_year,
@@ -106,5 +108,5 @@ async def dashboard(  # pylint: disable=too-many-locals
             "next_year": next_year,
             "next_month": next_month,
             "weekdays": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
-        }
+        },
     )
@@ -1,5 +1,6 @@
 """API routes for date-specific functionality."""
 
+import asyncio
 import io
 import logging
 import os
@@ -16,15 +17,15 @@ from fastapi import (
     HTTPException,
     BackgroundTasks,
 )
-from fastapi.responses import JSONResponse
 from PIL import Image
 from pydantic import BaseModel
 
+from src.api._json_response import FastJSONResponse
 from src.api.item_identification_tasks import analyze_image_background
 from src.auth import authenticate_user_from_request
 from src.configs import IMAGE_DIR
 from src.crud.crud_food_image_query import (
-    get_dish_image_queries_by_user_and_date,
+    get_dish_image_query_summaries_by_user_and_date,
     replace_slot_atomic,
 )
 
@@ -74,6 +75,9 @@ def _process_and_save_image(content: bytes, file_path: str) -> Image.Image:
     """Process image content: resize and convert to RGB, then save as JPEG."""
     img = Image.open(io.BytesIO(content))
     max_size = 384
+    # JPEG only: decode at the smallest 1/2^n scale still >= max_size, so a
+    # 12MP phone shot is never fully materialized just to be thumbnailed.
+    img.draft("RGB", (max_size, max_size))
     if img.width > max_size or img.height > max_size:
         img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
     if img.mode == "RGBA":
@@ -83,12 +87,13 @@ def _process_and_save_image(content: bytes, file_path: str) -> Image.Image:
     elif img.mode != "RGB":
         img = img.convert("RGB")
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    img.save(file_path, "JPEG")
+    # Every Gemini call re-sends this file; optimized Huffman tables trim it losslessly.
+    img.save(file_path, "JPEG", optimize=True)
     return img
 
 
 @router.get("/{year}/{month}/{day}")
-async def get_date(request: Request, year: int, month: int, day: int) -> JSONResponse:
+async def get_date(request: Request, year: int, month: int, day: int) -> FastJSONResponse:
     """Get analysis data for a specific date."""
     user = authenticate_user_from_request(request)
     if not user:
@@ -101,7 +106,7 @@ async def get_date(request: Request, year: int, month: int, day: int) -> JSONRes
 
     logger.info("Getting date data for user %s, date %s", user.id, target_date)
 
-    date_queries = get_dish_image_queries_by_user_and_date(user.id, target_date)
+    date_queries = get_dish_image_query_summaries_by_user_and_date(user.id, target_date)
 
     dish_data = {}
     for position in range(1, MAX_DISHES_PER_DATE + 1):
@@ -112,7 +117,7 @@ async def get_date(request: Request, year: int, month: int, day: int) -> JSONRes
             "image_url": position_query.image_url if position_query else None,
         }
 
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "target_date": target_date.isoformat(),
             "formatted_date": target_date.strftime("%B %d, %Y"),
@@ -135,7 +140,7 @@ async def upload_dish(
     *,
     dish_position: int = Form(...),
     file: UploadFile = File(...),
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Handle image upload for a specific date and dish position."""
     user = authenticate_user_from_request(request)
     if not user:
@@ -155,7 +160,8 @@ async def upload_dish(
     filename = _build_image_filename(user.id, dish_position)
     file_path = IMAGE_DIR / filename
     content = await file.read()
-    _process_and_save_image(content, str(file_path))
+    # PIL decode/resize/encode is CPU + disk work; keep it off the event loop.
+    await asyncio.to_thread(_process_and_save_image, content, str(file_path))
     target_datetime = datetime.combine(meal_date, datetime.min.time()).replace(tzinfo=timezone.utc)
 
     query, old_image_urls = replace_slot_atomic(
@@ -177,7 +183,7 @@ async def upload_dish(
     )
 
     background_tasks.add_task(analyze_image_background, query.id, str(file_path))
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "success": True,
             "message": "Image uploaded. Analysis in progress...",
@@ -201,7 +207,7 @@ async def upload_dish_from_url(
     month: int,
     day: int,
     body: ImageUrlUploadRequest,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """Handle image upload from URL for a specific date and dish position."""
     user = authenticate_user_from_request(request)
     if not user:
@@ -238,7 +244,7 @@ async def upload_dish_from_url(
     file_path = IMAGE_DIR / filename
 
     try:
-        _process_and_save_image(content, str(file_path))
+        await asyncio.to_thread(_process_and_save_image, content, str(file_path))
     except Exception as exc:
         logger.error("Failed to process image from URL %s: %s", image_url, exc)
         raise HTTPException(status_code=400, detail="Invalid image format") from exc
@@ -267,7 +273,7 @@ async def upload_dish_from_url(
     # Schedule analysis in background
     background_tasks.add_task(analyze_image_background, query.id, str(file_path))
 
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "success": True,
             "message": "Image uploaded from URL. Analysis in progress...",
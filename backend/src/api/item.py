@@ -10,8 +10,8 @@ import logging
 from pathlib import Path
 
 from fastapi import APIRouter, Request, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
 
+from src.api._json_response import FastJSONResponse
 from src.api.item_schemas import IdentificationConfirmationRequest
 from src.api.item_tasks import trigger_nutrition_analysis_background
 from src.auth import authenticate_user_from_request
@@ -62,7 +62,7 @@ def _enrich_personalization_row(record_id: int, confirmation: IdentificationConf
 
 
 @router.get("/{record_id}")
-async def item_detail(record_id: int, request: Request) -> JSONResponse:
+async def item_detail(record_id: int, request: Request) -> FastJSONResponse:
     """
     Get detailed information for a specific dish image query record.
 
@@ -75,7 +75,7 @@ async def item_detail(record_id: int, request: Request) -> JSONResponse:
         request (Request): FastAPI request object
 
     Returns:
-        JSONResponse: JSON data with analysis results
+        FastJSONResponse: JSON data with analysis results
 
     Raises:
         HTTPException: 401 if not authenticated, 404 if record not found
@@ -130,13 +130,13 @@ async def item_detail(record_id: int, request: Request) -> JSONResponse:
         "total_iterations": total_iterations,
     }
 
-    return JSONResponse(content=item_data)
+    return FastJSONResponse(content=item_data)
 
 
 @router.patch("/{record_id}/metadata")
 async def update_item_metadata(
     record_id: int, request: Request, metadata: MetadataUpdate
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     Update metadata (dish, serving size, servings count) for current iteration.
 
@@ -150,7 +150,7 @@ async def update_item_metadata(
         metadata (MetadataUpdate): Metadata to update
 
     Returns:
-        JSONResponse: Success status and metadata_modified flag
+        FastJSONResponse: Success status and metadata_modified flag
 
     Raises:
         HTTPException: 401 if not authenticated, 404 if record not found,
@@ -186,7 +186,7 @@ async def update_item_metadata(
         if not success:
             raise HTTPException(status_code=400, detail="Failed to update metadata")
 
-        return JSONResponse(
+        return FastJSONResponse(
             content={
                 "success": True,
                 "message": "Metadata updated successfully",
@@ -205,7 +205,7 @@ async def confirm_identification_and_trigger_nutrition(
     request: Request,
     background_tasks: BackgroundTasks,
     confirmation: IdentificationConfirmationRequest,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     Confirm Step 1 data and trigger Step 2 nutritional analysis.
 
@@ -219,7 +219,7 @@ async def confirm_identification_and_trigger_nutrition(
         confirmation (IdentificationConfirmationRequest): Confirmed Step 1 data
 
     Returns:
-        JSONResponse: Success response with confirmation status
+        FastJSONResponse: Success response with confirmation status
 
     Raises:
         HTTPException: 401 if not authenticated, 404 if record not found,
@@ -283,7 +283,7 @@ async def confirm_identification_and_trigger_nutrition(
         components_data,
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "success": True,
             "message": "Step 1 confirmed. Step 2 analysis in progress...",
@@ -21,8 +21,8 @@ import logging
 from typing import Any, Dict
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
 
+from src.api._json_response import FastJSONResponse
 from src.api.item_schemas import AiAssistantCorrectionRequest, NutritionCorrectionRequest
 from src.auth import authenticate_user_from_request
 from src.crud import crud_personalized_food
@@ -64,7 +64,7 @@ async def save_nutrition_correction(
     record_id: int,
     request: Request,
     correction: NutritionCorrectionRequest,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     Save a user correction of the Step 2 nutritional analysis.
 
@@ -100,7 +100,7 @@ async def save_nutrition_correction(
 
     _enrich_personalization_corrected_data(record_id, payload)
 
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "success": True,
             "record_id": record_id,
@@ -133,7 +133,7 @@ async def save_ai_assistant_correction(
     record_id: int,
     request: Request,
     body: AiAssistantCorrectionRequest,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     Stage 10 — prompt-driven Step 2 revision.
 
@@ -181,7 +181,7 @@ async def save_ai_assistant_correction(
 
     _enrich_personalization_corrected_data(record_id, payload)
 
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "success": True,
             "record_id": record_id,
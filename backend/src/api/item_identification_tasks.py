@@ -6,6 +6,7 @@ file cap and so the Phase 1 + Phase 2 backgrounds tasks have parallel homes
 (`item_identification_tasks.py` ↔ `item_tasks.py`).
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -127,7 +128,9 @@ async def analyze_image_background(query_id: int, file_path: str, retry_count: i
         reference_from_blob = (
             (record_pre_pro.result_gemini or {}).get("reference_image") if record_pre_pro else None
         )
-        reference_image_bytes, effective_reference = _resolve_reference_inputs(reference_from_blob)
+        reference_image_bytes, effective_reference = await asyncio.to_thread(
+            _resolve_reference_inputs, reference_from_blob
+        )
 
         identification_prompt = get_component_identification_prompt(reference=effective_reference)
         identification_result = await analyze_component_identification_async(
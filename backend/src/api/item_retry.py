@@ -10,8 +10,8 @@ import logging
 from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
-from fastapi.responses import JSONResponse
 
+from src.api._json_response import FastJSONResponse
 from src.api.item_identification_tasks import analyze_image_background
 from src.api.item_tasks import trigger_nutrition_analysis_background
 from src.auth import authenticate_user_from_request
@@ -31,7 +31,7 @@ async def retry_nutrition_analysis(
     record_id: int,
     request: Request,
     background_tasks: BackgroundTasks,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     Re-run Step 2 nutritional analysis after a prior failure.
 
@@ -80,7 +80,7 @@ async def retry_nutrition_analysis(
         new_retry_count,
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "success": True,
             "message": "Step 2 analysis re-scheduled.",
@@ -96,7 +96,7 @@ async def retry_identification_analysis(
     record_id: int,
     request: Request,
     background_tasks: BackgroundTasks,
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     Re-run Phase 1 (Component Identification) after a prior failure.
 
@@ -137,7 +137,7 @@ async def retry_identification_analysis(
         analyze_image_background, record_id, str(image_path), new_retry_count
     )
 
-    return JSONResponse(
+    return FastJSONResponse(
         content={
             "success": True,
             "message": "Step 1 analysis re-scheduled.",
@@ -183,7 +183,9 @@ async def trigger_nutrition_analysis_background(
         # matches + bytes into the prompt + analyzer so the threshold-gated
         # reference blocks and the two-image Pro call exercise the Phase 2.3
         # reference-assisted path.
-        reference_image_bytes = _resolve_phase_2_2_image_bytes(personalized_matches)
+        reference_image_bytes = await asyncio.to_thread(
+            _resolve_phase_2_2_image_bytes, personalized_matches
+        )
 
         nutrition_prompt = get_nutritional_analysis_prompt(
             dish_name=dish_name,
@@ -6,10 +6,11 @@ with session management.
 """
 
 import logging
-from fastapi import APIRouter, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request, Response, status
 from pydantic import BaseModel
 
+from src.api._http_cache import etag_json_response
+from src.api._json_response import FastJSONResponse
 from src.auth import authenticate_user, authenticate_user_from_request, create_access_token
 
 # Setup logger
@@ -27,7 +28,7 @@ class LoginRequest(BaseModel):
 
 
 @router.post("/")
-async def process_login(login_data: LoginRequest) -> JSONResponse:
+async def process_login(login_data: LoginRequest) -> FastJSONResponse:
     """
     Handle POST request for user login.
 
@@ -38,7 +39,7 @@ async def process_login(login_data: LoginRequest) -> JSONResponse:
         login_data (LoginRequest): Login credentials
 
     Returns:
-        JSONResponse: JSON response with auth status and user data
+        FastJSONResponse: JSON response with auth status and user data
     """
     logger.info("Login attempt for username: %s", login_data.username)
 
@@ -47,7 +48,7 @@ async def process_login(login_data: LoginRequest) -> JSONResponse:
 
     if not user:
         logger.error("Authentication failed for: %s", login_data.username)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"success": False, "message": "Invalid username or password"},
         )
@@ -58,7 +59,7 @@ async def process_login(login_data: LoginRequest) -> JSONResponse:
     access_token = create_access_token(data={"username": login_data.username})
 
     # Create response with user data
-    response = JSONResponse(
+    response = FastJSONResponse(
         content={
             "success": True,
             "message": "Login successful",
@@ -79,30 +80,36 @@ async def process_login(login_data: LoginRequest) -> JSONResponse:
 
 
 @router.get("/session")
-async def get_session(request: Request) -> JSONResponse:
-    """Return the current user if the session cookie is valid, 401 otherwise."""
+async def get_session(request: Request) -> Response:
+    """
+    Return the current user if the session cookie is valid, 401 otherwise.
+
+    The success body carries an `ETag` so repeat session checks on page
+    navigation revalidate to a 304.
+    """
     user = authenticate_user_from_request(request)
     if not user:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"success": False, "message": "Not authenticated"},
         )
-    return JSONResponse(
-        content={
+    return etag_json_response(
+        request,
+        {
             "success": True,
             "user": {"id": user.id, "username": user.username},
-        }
+        },
     )
 
 
 @router.post("/logout")
-async def logout() -> JSONResponse:
+async def logout() -> FastJSONResponse:
     """
     Handle user logout.
 
     Returns:
-        JSONResponse: JSON response confirming logout
+        FastJSONResponse: JSON response confirming logout
     """
-    response = JSONResponse(content={"success": True, "message": "Logout successful"})
+    response = FastJSONResponse(content={"success": True, "message": "Logout successful"})
     response.delete_cookie(key="access_token")
     return response
@@ -14,7 +14,6 @@ This file serves as a facade to maintain backward compatibility.
 from src.crud.dish_query_basic import (
     create_dish_image_query,
     get_dish_image_query_by_id,
-    get_dish_image_queries_by_user,
     update_dish_image_query_results,
     confirm_identification_atomic,
     replace_slot_atomic,
@@ -22,7 +21,10 @@ from src.crud.dish_query_basic import (
 )
 
 from src.crud.dish_query_filters import (
+    get_dish_image_queries_by_user,
+    get_dish_image_queries_by_user_summary,
     get_dish_image_queries_by_user_and_date,
+    get_dish_image_query_summaries_by_user_and_date,
     get_single_dish_by_user_date_position,
     get_calendar_data,
 )
@@ -40,13 +42,15 @@ __all__ = [
     # Basic CRUD
     "create_dish_image_query",
     "get_dish_image_query_by_id",
-    "get_dish_image_queries_by_user",
     "update_dish_image_query_results",
     "confirm_identification_atomic",
     "replace_slot_atomic",
     "delete_dish_image_query_by_id",
     # Filters and queries
+    "get_dish_image_queries_by_user",
+    "get_dish_image_queries_by_user_summary",
     "get_dish_image_queries_by_user_and_date",
+    "get_dish_image_query_summaries_by_user_and_date",
     "get_single_dish_by_user_date_position",
     "get_calendar_data",
     # Iterations
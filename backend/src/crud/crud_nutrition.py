@@ -89,8 +89,7 @@ def bulk_upsert_foods(rows: List[Dict[str, Any]]) -> int:
     now = datetime.now(timezone.utc)
     payload = [{**row, "created_at": now, "updated_at": now} for row in rows]
 
-    db = SessionLocal()
-    try:
+    with SessionLocal.begin() as db:
         insert_ = _insert_for(db.get_bind())
         excluded = insert_(NutritionFood).excluded
         update_cols = {
@@ -115,13 +114,7 @@ def bulk_upsert_foods(rows: List[Dict[str, Any]]) -> int:
                 set_=update_cols,
             )
             db.execute(stmt)
-        db.commit()
         return len(payload)
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def bulk_upsert_myfcd_nutrients(rows: List[Dict[str, Any]]) -> int:
@@ -138,8 +131,7 @@ def bulk_upsert_myfcd_nutrients(rows: List[Dict[str, Any]]) -> int:
         return 0
 
     rows = _dedupe_last(rows, ("ndb_id", "nutrient_name"))
-    db = SessionLocal()
-    try:
+    with SessionLocal.begin() as db:
         insert_ = _insert_for(db.get_bind())
         excluded = insert_(NutritionMyfcdNutrient).excluded
         update_cols = {
@@ -155,13 +147,7 @@ def bulk_upsert_myfcd_nutrients(rows: List[Dict[str, Any]]) -> int:
                 set_=update_cols,
             )
             db.execute(stmt)
-        db.commit()
         return len(rows)
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def get_all_foods_grouped_by_source() -> Dict[str, List[NutritionFood]]:
@@ -174,15 +160,12 @@ def get_all_foods_grouped_by_source() -> Dict[str, List[NutritionFood]]:
         the service is responsible for treating an entirely-empty corpus
         as an error.
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         rows = db.query(NutritionFood).order_by(NutritionFood.id.asc()).all()
         # Detach from session so the service can close the call without
         # losing access to the column values during BM25 index build.
         for row in rows:
             db.expunge(row)
-    finally:
-        db.close()
 
     grouped: Dict[str, List[NutritionFood]] = {src: [] for src in _FOOD_SOURCES}
     for row in rows:
@@ -198,13 +181,10 @@ def get_myfcd_nutrients_grouped_by_ndb_id() -> Dict[str, List[NutritionMyfcdNutr
     Returns:
         Dict[str, List[NutritionMyfcdNutrient]]: ndb_id -> nutrient rows
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         rows = db.query(NutritionMyfcdNutrient).order_by(NutritionMyfcdNutrient.id.asc()).all()
         for row in rows:
             db.expunge(row)
-    finally:
-        db.close()
 
     grouped: Dict[str, List[NutritionMyfcdNutrient]] = {}
     for row in rows:
@@ -220,11 +200,8 @@ def count_foods_by_source() -> Dict[str, int]:
         Dict[str, int]: Always includes every source name in
         `_FOOD_SOURCES`; sources with no rows report 0.
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         rows = db.query(NutritionFood.source).all()
-    finally:
-        db.close()
 
     counts: Dict[str, int] = {src: 0 for src in _FOOD_SOURCES}
     for (source,) in rows:
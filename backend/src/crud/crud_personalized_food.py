@@ -46,8 +46,7 @@ def insert_description_row(
     Raises:
         Exception: If insert fails (e.g. unique violation on query_id)
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         now = datetime.now(timezone.utc)
         row = PersonalizedFoodDescription(
             user_id=user_id,
@@ -63,11 +62,6 @@ def insert_description_row(
         db.commit()
         db.refresh(row)
         return row
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def update_confirmed_fields(
@@ -91,8 +85,7 @@ def update_confirmed_fields(
         row does not exist. Missing rows are not treated as an error — the
         caller (Stage 4) logs and moves on.
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         row = (
             db.query(PersonalizedFoodDescription)
             .filter(PersonalizedFoodDescription.query_id == query_id)
@@ -107,11 +100,6 @@ def update_confirmed_fields(
         db.commit()
         db.refresh(row)
         return row
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def update_corrected_nutrition_data(
@@ -129,8 +117,7 @@ def update_corrected_nutrition_data(
         Optional[PersonalizedFoodDescription]: Updated row, or None if the
         row does not exist.
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         row = (
             db.query(PersonalizedFoodDescription)
             .filter(PersonalizedFoodDescription.query_id == query_id)
@@ -143,11 +130,6 @@ def update_corrected_nutrition_data(
         db.commit()
         db.refresh(row)
         return row
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def get_row_by_query_id(query_id: int) -> Optional[PersonalizedFoodDescription]:
@@ -164,15 +146,12 @@ def get_row_by_query_id(query_id: int) -> Optional[PersonalizedFoodDescription]:
     Returns:
         Optional[PersonalizedFoodDescription]: The row, or None if absent.
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         return (
             db.query(PersonalizedFoodDescription)
             .filter(PersonalizedFoodDescription.query_id == query_id)
             .first()
         )
-    finally:
-        db.close()
 
 
 def get_all_rows_for_user(
@@ -193,13 +172,10 @@ def get_all_rows_for_user(
         List[PersonalizedFoodDescription]: Rows ordered by `id ASC` for
         deterministic test behavior.
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         query = db.query(PersonalizedFoodDescription).filter(
             PersonalizedFoodDescription.user_id == user_id
         )
         if exclude_query_id is not None:
             query = query.filter(PersonalizedFoodDescription.query_id != exclude_query_id)
         return query.order_by(PersonalizedFoodDescription.id.asc()).all()
-    finally:
-        db.close()
@@ -17,6 +17,11 @@ def get_db_session() -> Session:
     """
     Get a database session for CRUD operations.
 
+    Use as a context manager (`with get_db_session() as db:`) so the
+    session is closed — and any uncommitted transaction rolled back —
+    on exit. Write paths that return plain values use
+    `with get_db_session() as db, db.begin():` to commit on success.
+
     Returns:
         Session: SQLAlchemy database session
     """
@@ -33,11 +38,8 @@ def get_user_by_username(username: str) -> Optional[Users]:
     Returns:
         Optional[Users]: User object if found, None otherwise
     """
-    db = get_db_session()
-    try:
+    with get_db_session() as db:
         return db.query(Users).filter(Users.username == username).first()
-    finally:
-        db.close()
 
 
 def get_user_by_id(user_id: int) -> Optional[Users]:
@@ -50,11 +52,8 @@ def get_user_by_id(user_id: int) -> Optional[Users]:
     Returns:
         Optional[Users]: User object if found, None otherwise
     """
-    db = get_db_session()
-    try:
+    with get_db_session() as db:
         return db.query(Users).filter(Users.id == user_id).first()
-    finally:
-        db.close()
 
 
 def create_user(username: str, hashed_password: str, role: Optional[str] = None) -> Users:
@@ -72,18 +71,12 @@ def create_user(username: str, hashed_password: str, role: Optional[str] = None)
     Raises:
         Exception: If user creation fails
     """
-    db = get_db_session()
-    try:
+    with get_db_session() as db:
         db_user = Users(username=username, hashed_password=hashed_password, role=role)
         db.add(db_user)
         db.commit()
         db.refresh(db_user)
         return db_user
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def update_user_password(user_id: int, new_hashed_password: str) -> Optional[Users]:
@@ -100,19 +93,13 @@ def update_user_password(user_id: int, new_hashed_password: str) -> Optional[Use
     Raises:
         Exception: If password update fails
     """
-    db = get_db_session()
-    try:
+    with get_db_session() as db:
         user = db.query(Users).filter(Users.id == user_id).first()
         if user:
             user.hashed_password = new_hashed_password
             db.commit()
             db.refresh(user)
         return user
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def delete_user(user_id: int) -> bool:
@@ -128,16 +115,9 @@ def delete_user(user_id: int) -> bool:
     Raises:
         Exception: If user deletion fails
     """
-    db = get_db_session()
-    try:
+    with get_db_session() as db, db.begin():
         user = db.query(Users).filter(Users.id == user_id).first()
         if user:
             db.delete(user)
-            db.commit()
             return True
         return False
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
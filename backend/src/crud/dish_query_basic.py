@@ -7,7 +7,7 @@ This module provides Create, Read, Update, Delete operations.
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Tuple
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, delete, func, insert, or_, select
 
 from src.database import SessionLocal
 from src.models import DishImageQuery
@@ -41,8 +41,7 @@ def create_dish_image_query(
     Raises:
         Exception: If query creation fails
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         db_query = DishImageQuery(
             user_id=user_id,
             image_url=image_url,
@@ -56,11 +55,6 @@ def create_dish_image_query(
         db.commit()
         db.refresh(db_query)
         return db_query
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def get_dish_image_query_by_id(query_id: int) -> Optional[DishImageQuery]:
@@ -73,33 +67,8 @@ def get_dish_image_query_by_id(query_id: int) -> Optional[DishImageQuery]:
     Returns:
         Optional[DishImageQuery]: Query object if found, None otherwise
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         return db.query(DishImageQuery).filter(DishImageQuery.id == query_id).first()
-    finally:
-        db.close()
-
-
-def get_dish_image_queries_by_user(user_id: int) -> List[DishImageQuery]:
-    """
-    Get all dish image queries for a specific user.
-
-    Args:
-        user_id (int): ID of the user
-
-    Returns:
-        List[DishImageQuery]: List of query objects for the user
-    """
-    db = SessionLocal()
-    try:
-        return (
-            db.query(DishImageQuery)
-            .filter(DishImageQuery.user_id == user_id)
-            .order_by(DishImageQuery.created_at.desc())
-            .all()
-        )
-    finally:
-        db.close()
 
 
 def update_dish_image_query_results(
@@ -121,8 +90,7 @@ def update_dish_image_query_results(
     Raises:
         Exception: If update fails
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         query = db.query(DishImageQuery).filter(DishImageQuery.id == query_id).first()
 
         if query:
@@ -136,11 +104,6 @@ def update_dish_image_query_results(
             return query
 
         return None
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def replace_slot_atomic(
@@ -165,12 +128,12 @@ def replace_slot_atomic(
         old image files from disk after the transaction commits.
     """
     target_day = target_date.date()
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
+        # Lock only the columns we need; the result blobs stay on the server.
         # pylint: disable=not-callable
-        existing = (
-            db.query(DishImageQuery)
-            .filter(
+        existing = db.execute(
+            select(DishImageQuery.id, DishImageQuery.image_url)
+            .where(
                 DishImageQuery.user_id == user_id,
                 DishImageQuery.dish_position == dish_position,
                 or_(
@@ -185,32 +148,35 @@ def replace_slot_atomic(
                 ),
             )
             .with_for_update()
-            .all()
-        )
+        ).all()
         # pylint: enable=not-callable
 
         old_image_urls = [row.image_url for row in existing if row.image_url]
-        for row in existing:
-            db.delete(row)
+        if existing:
+            db.execute(
+                delete(DishImageQuery).where(DishImageQuery.id.in_([row.id for row in existing]))
+            )
 
-        new_row = DishImageQuery(
-            user_id=user_id,
-            image_url=image_url,
-            result_openai=None,
-            result_gemini=None,
-            dish_position=dish_position,
-            created_at=datetime.now(timezone.utc),
-            target_date=target_date,
-        )
-        db.add(new_row)
+        # INSERT ... RETURNING loads the full row in the same round-trip;
+        # expunging before commit keeps that state instead of expiring it
+        # and paying for a refresh SELECT.
+        new_row = db.scalars(
+            insert(DishImageQuery).returning(DishImageQuery),
+            [
+                {
+                    "user_id": user_id,
+                    "image_url": image_url,
+                    "result_openai": None,
+                    "result_gemini": None,
+                    "dish_position": dish_position,
+                    "created_at": datetime.now(timezone.utc),
+                    "target_date": target_date,
+                }
+            ],
+        ).one()
+        db.expunge(new_row)
         db.commit()
-        db.refresh(new_row)
         return new_row, old_image_urls
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def confirm_identification_atomic(
@@ -234,8 +200,7 @@ def confirm_identification_atomic(
         "not_found"   — no record exists with that id.
         "no_step1"    — Step 1 has not produced a result yet (phase != 1).
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal.begin() as db:
         query = (
             db.query(DishImageQuery)
             .filter(DishImageQuery.id == query_id)
@@ -256,14 +221,7 @@ def confirm_identification_atomic(
         result_gemini["confirmed_dish_name"] = confirmed_dish_name
         result_gemini["confirmed_components"] = confirmed_components
         query.result_gemini = result_gemini
-
-        db.commit()
         return "confirmed"
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def delete_dish_image_query_by_id(query_id: int) -> bool:
@@ -279,18 +237,11 @@ def delete_dish_image_query_by_id(query_id: int) -> bool:
     Raises:
         Exception: If deletion fails
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal.begin() as db:
         query = db.query(DishImageQuery).filter(DishImageQuery.id == query_id).first()
 
         if query:
             db.delete(query)
-            db.commit()
             return True
 
         return False
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
@@ -2,15 +2,129 @@
 Query and filter operations for dish image queries.
 
 This module provides filtered query operations for finding dishes
-by date, position, and calendar data.
+by user history, date, position, and calendar data.
 """
 
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import func, or_, and_
+from sqlalchemy import Row, func, or_, and_, select, tuple_
 from src.database import SessionLocal
 from src.models import DishImageQuery
 
+# Columns list views need; excludes the result_openai / result_gemini blobs.
+SUMMARY_COLUMNS = (
+    DishImageQuery.id,
+    DishImageQuery.image_url,
+    DishImageQuery.dish_position,
+    DishImageQuery.created_at,
+    DishImageQuery.target_date,
+)
+
+DEFAULT_PAGE_SIZE = 50
+
+# (created_at, id) of the last row on a page; `id` breaks created_at ties.
+HistoryCursor = Tuple[datetime, int]
+
+# Newest first, with `id` as the tie-breaker the cursor compares against.
+_HISTORY_ORDER = (DishImageQuery.created_at.desc(), DishImageQuery.id.desc())
+
+
+def _user_history_page(user_id: int, before: Optional[HistoryCursor]):
+    """Keyset predicate for one page of a user's history, newest first."""
+    filters = [DishImageQuery.user_id == user_id]
+    if before is not None:
+        filters.append(tuple_(DishImageQuery.created_at, DishImageQuery.id) < tuple_(*before))
+    return filters
+
+
+def _next_cursor(rows: list, limit: int) -> Optional[HistoryCursor]:
+    """Cursor after the last row when the page is full, else None (no more pages)."""
+    return (rows[-1].created_at, rows[-1].id) if len(rows) == limit else None
+
+
+def get_dish_image_queries_by_user(
+    user_id: int,
+    limit: int = DEFAULT_PAGE_SIZE,
+    before: Optional[HistoryCursor] = None,
+) -> Tuple[List[DishImageQuery], Optional[HistoryCursor]]:
+    """
+    Get one page of a user's dish image queries, newest first.
+
+    Keyset-paginated on `(created_at, id)`, so each page is an index range
+    scan regardless of history length, and rows sharing a `created_at`
+    are neither skipped nor repeated across a page boundary.
+
+    Args:
+        user_id (int): ID of the user
+        limit (int): Maximum number of rows to return
+        before (Optional[HistoryCursor]): `next_cursor` from the previous
+            page; only rows strictly after it in the ordering are returned
+
+    Returns:
+        Tuple[List[DishImageQuery], Optional[HistoryCursor]]: The page and
+        `next_cursor` for the following page (None when this is the last)
+    """
+    with SessionLocal() as db:
+        rows = (
+            db.query(DishImageQuery)
+            .filter(*_user_history_page(user_id, before))
+            .order_by(*_HISTORY_ORDER)
+            .limit(limit)
+            .all()
+        )
+    return rows, _next_cursor(rows, limit)
+
+
+def get_dish_image_queries_by_user_summary(
+    user_id: int,
+    limit: int = DEFAULT_PAGE_SIZE,
+    before: Optional[HistoryCursor] = None,
+) -> Tuple[List[Row], Optional[HistoryCursor]]:
+    """
+    Get one page of lightweight dish image query summaries for a user.
+
+    Projects only `SUMMARY_COLUMNS`, so the potentially large
+    `result_openai` / `result_gemini` JSON blobs never leave Postgres.
+    Paginated like `get_dish_image_queries_by_user`.
+
+    Args:
+        user_id (int): ID of the user
+        limit (int): Maximum number of rows to return
+        before (Optional[HistoryCursor]): `next_cursor` from the previous page
+
+    Returns:
+        Tuple[List[Row], Optional[HistoryCursor]]: Rows with `id`,
+        `image_url`, `dish_position`, `created_at`, `target_date` (newest
+        first), and `next_cursor`
+    """
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(*SUMMARY_COLUMNS)
+            .where(*_user_history_page(user_id, before))
+            .order_by(*_HISTORY_ORDER)
+            .limit(limit)
+        ).all()
+    return rows, _next_cursor(rows, limit)
+
+
+def _on_date(query_date):
+    """Match rows whose target_date (or created_at when NULL) falls on `query_date`."""
+    # pylint: disable=not-callable
+    return or_(
+        # Primary: Use target_date if it exists
+        and_(
+            DishImageQuery.target_date.isnot(None),
+            func.date(DishImageQuery.target_date) == query_date,
+        ),
+        # Fallback: Use created_at if target_date is NULL
+        and_(
+            DishImageQuery.target_date.is_(None),
+            func.date(DishImageQuery.created_at) == query_date,
+        ),
+    )
+    # pylint: enable=not-callable
+
 
 def get_dish_image_queries_by_user_and_date(user_id: int, query_date) -> List[DishImageQuery]:
     """
@@ -23,38 +137,43 @@ def get_dish_image_queries_by_user_and_date(user_id: int, query_date) -> List[Di
     Returns:
         List[DishImageQuery]: List of queries for the specified date
     """
-    db = SessionLocal()
-    try:
-        # Build base filters
-        # pylint: disable=not-callable
-        filters = [
-            DishImageQuery.user_id == user_id,
-            or_(
-                # Primary: Use target_date if it exists
-                and_(
-                    DishImageQuery.target_date.isnot(None),
-                    func.date(DishImageQuery.target_date) == query_date,
-                ),
-                # Fallback: Use created_at if target_date is NULL
-                and_(
-                    DishImageQuery.target_date.is_(None),
-                    func.date(DishImageQuery.created_at) == query_date,
-                ),
-            ),
-        ]
-        # pylint: enable=not-callable
-
+    with SessionLocal() as db:
         return (
             db.query(DishImageQuery)
-            .filter(*filters)
+            .filter(DishImageQuery.user_id == user_id, _on_date(query_date))
             .order_by(
                 DishImageQuery.dish_position.asc().nulls_last(),
                 DishImageQuery.created_at.desc(),
             )
             .all()
         )
-    finally:
-        db.close()
+
+
+def get_dish_image_query_summaries_by_user_and_date(user_id: int, query_date) -> List[Row]:
+    """
+    Get lightweight summaries of a user's dish image queries for one date.
+
+    Same filter and ordering as `get_dish_image_queries_by_user_and_date`,
+    but projects only `SUMMARY_COLUMNS` so the date view does not pull the
+    `result_openai` / `result_gemini` blobs it never renders.
+
+    Args:
+        user_id (int): ID of the user
+        query_date: Date to filter queries for
+
+    Returns:
+        List[Row]: Rows with `id`, `image_url`, `dish_position`,
+        `created_at`, `target_date`
+    """
+    with SessionLocal() as db:
+        return db.execute(
+            select(*SUMMARY_COLUMNS)
+            .where(DishImageQuery.user_id == user_id, _on_date(query_date))
+            .order_by(
+                DishImageQuery.dish_position.asc().nulls_last(),
+                DishImageQuery.created_at.desc(),
+            )
+        ).all()
 
 
 def get_single_dish_by_user_date_position(
@@ -71,26 +190,13 @@ def get_single_dish_by_user_date_position(
     Returns:
         Optional[DishImageQuery]: Single dish for the position, or None
     """
-    db = SessionLocal()
-    try:
-        # pylint: disable=not-callable
+    with SessionLocal() as db:
         result = (
             db.query(DishImageQuery)
             .filter(
                 DishImageQuery.user_id == user_id,
                 DishImageQuery.dish_position == dish_position,
-                or_(
-                    # Primary: Use target_date if it exists
-                    and_(
-                        DishImageQuery.target_date.isnot(None),
-                        func.date(DishImageQuery.target_date) == query_date,
-                    ),
-                    # Fallback: Use created_at if target_date is NULL
-                    and_(
-                        DishImageQuery.target_date.is_(None),
-                        func.date(DishImageQuery.created_at) == query_date,
-                    ),
-                ),
+                _on_date(query_date),
             )
             .order_by(
                 DishImageQuery.target_date.desc().nulls_last(),
@@ -98,11 +204,8 @@ def get_single_dish_by_user_date_position(
             )
             .first()
         )
-        # pylint: enable=not-callable
 
         return result
-    finally:
-        db.close()
 
 
 def get_calendar_data(user_id: int, year: int, month: int) -> Dict[str, int]:
@@ -117,8 +220,7 @@ def get_calendar_data(user_id: int, year: int, month: int) -> Dict[str, int]:
     Returns:
         Dict[str, int]: Dictionary mapping date strings (YYYY-MM-DD) to dish counts
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         # Query to get count of dishes per day for the specified month/year
         # pylint: disable=not-callable
         results = (
@@ -143,5 +245,3 @@ def get_calendar_data(user_id: int, year: int, month: int) -> Dict[str, int]:
             calendar_data[date_str] = count
 
         return calendar_data
-    finally:
-        db.close()
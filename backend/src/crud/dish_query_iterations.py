@@ -8,14 +8,47 @@ analysis versions with user feedback and metadata changes.
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
+from sqlalchemy import Text, case, cast, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 from src.database import SessionLocal
 from src.models import DishImageQuery
 from src.crud.dish_query_basic import get_dish_image_query_by_id
 
 
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (iteration `created_at` format)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _legacy_iteration(record: DishImageQuery, now: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Wrap a legacy (pre-iterations) result_gemini as a single iteration.
+
+    The clock is only read when the record has no `created_at` and the
+    caller did not pass `now`.
+    """
+    return {
+        "iteration_number": 1,
+        "created_at": (
+            record.created_at.isoformat() if record.created_at else (now or _now_iso())
+        ),
+        "user_feedback": None,
+        "metadata": {
+            "selected_dish": record.result_gemini.get("dish_name", "Unknown"),
+            "selected_serving_size": None,
+            "number_of_servings": 1.0,
+            "metadata_modified": False,
+        },
+        "analysis": record.result_gemini,
+    }
+
+
 def initialize_iterations_structure(
-    analysis_result: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None
+    analysis_result: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None,
+    now: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Initialize iteration structure for first analysis.
@@ -23,6 +56,8 @@ def initialize_iterations_structure(
     Args:
         analysis_result (Dict[str, Any]): The analysis result from LLM
         metadata (Optional[Dict[str, Any]]): Optional metadata for iteration
+        now (Optional[str]): ISO timestamp to stamp on the iteration; lets a
+            caller that builds several iterations share one clock read
 
     Returns:
         Dict[str, Any]: Iterations structure with first iteration
@@ -40,7 +75,7 @@ def initialize_iterations_structure(
         "iterations": [
             {
                 "iteration_number": 1,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": now or _now_iso(),
                 "user_feedback": None,
                 "metadata": metadata,
                 "analysis": analysis_result,
@@ -50,12 +85,16 @@ def initialize_iterations_structure(
     }
 
 
-def get_current_iteration(record: DishImageQuery) -> Optional[Dict[str, Any]]:
+def get_current_iteration(
+    record: DishImageQuery, now: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
     """
     Get the current iteration from result_gemini.
 
     Args:
         record (DishImageQuery): The query record
+        now (Optional[str]): ISO timestamp to use if a legacy record has no
+            `created_at`; defaults to the current time
 
     Returns:
         Optional[Dict[str, Any]]: Current iteration data, or None if not found
@@ -66,22 +105,7 @@ def get_current_iteration(record: DishImageQuery) -> Optional[Dict[str, Any]]:
     # Handle legacy format (direct analysis without iterations)
     if "iterations" not in record.result_gemini:
         # Convert to iterations format on-the-fly
-        return {
-            "iteration_number": 1,
-            "created_at": (
-                record.created_at.isoformat()
-                if record.created_at
-                else datetime.now(timezone.utc).isoformat()
-            ),
-            "user_feedback": None,
-            "metadata": {
-                "selected_dish": record.result_gemini.get("dish_name", "Unknown"),
-                "selected_serving_size": None,
-                "number_of_servings": 1.0,
-                "metadata_modified": False,
-            },
-            "analysis": record.result_gemini,
-        }
+        return _legacy_iteration(record, now)
 
     # Get current iteration from iterations array
     current_idx = record.result_gemini.get("current_iteration", 1) - 1
@@ -110,24 +134,26 @@ def add_metadata_reanalysis_iteration(
     Raises:
         Exception: If update fails
     """
-    db = SessionLocal()
-    try:
+    with SessionLocal() as db:
         query = db.query(DishImageQuery).filter(DishImageQuery.id == query_id).first()
 
         if not query:
             return None
 
+        # One clock read shared by the legacy conversion and the new iteration
+        now = _now_iso()
+
         # Ensure result_gemini has iterations structure
         if not query.result_gemini or "iterations" not in query.result_gemini:
             # Initialize iterations structure with existing data
             existing_analysis = query.result_gemini or {}
-            query.result_gemini = initialize_iterations_structure(existing_analysis)
+            query.result_gemini = initialize_iterations_structure(existing_analysis, now=now)
 
         # Create new iteration
         new_iteration_number = len(query.result_gemini["iterations"]) + 1
         new_iteration = {
             "iteration_number": new_iteration_number,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
             "user_feedback": None,
             "metadata": {**metadata, "metadata_modified": True},
             "analysis": analysis_result,
@@ -143,11 +169,6 @@ def add_metadata_reanalysis_iteration(
         db.commit()
         db.refresh(query)
         return query
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
 
 
 def update_metadata(
@@ -171,8 +192,18 @@ def update_metadata(
     Raises:
         Exception: If update fails
     """
-    db = SessionLocal()
-    try:
+    patch = {
+        "selected_dish": selected_dish,
+        "selected_serving_size": selected_serving_size,
+        "number_of_servings": number_of_servings,
+        "metadata_modified": True,
+    }
+    with SessionLocal.begin() as db:
+        if db.get_bind().dialect.name == "postgresql":
+            patched = _patch_current_metadata(db, query_id, patch)
+            if patched is not None:
+                return patched
+
         query = db.query(DishImageQuery).filter(DishImageQuery.id == query_id).first()
 
         if not query or not query.result_gemini:
@@ -188,27 +219,66 @@ def update_metadata(
 
         if 0 <= current_idx < len(iterations):
             # Update metadata
-            iterations[current_idx]["metadata"].update(
-                {
-                    "selected_dish": selected_dish,
-                    "selected_serving_size": selected_serving_size,
-                    "number_of_servings": number_of_servings,
-                    "metadata_modified": True,
-                }
-            )
+            iterations[current_idx]["metadata"].update(patch)
 
             # Mark as modified for SQLAlchemy
             flag_modified(query, "result_gemini")
-
-            db.commit()
             return True
 
         return False
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+
+
+def _patch_current_metadata(db: Session, query_id: int, patch: Dict[str, Any]) -> Optional[bool]:
+    """
+    Merge `patch` into the current iteration's metadata server-side.
+
+    Reads only `current_iteration` and the iteration count, then rewrites
+    the single `{iterations,<idx>,metadata}` path with `jsonb_set`, so the
+    result_gemini blob never crosses the wire in either direction.
+
+    Returns:
+        Optional[bool]: True/False like `update_metadata`, or None when the
+        record is missing or still in legacy (pre-iterations) format and
+        the caller should take the ORM path.
+    """
+    doc = cast(DishImageQuery.result_gemini, JSONB)
+    row = db.execute(
+        select(
+            doc["current_iteration"].astext,
+            func.jsonb_array_length(doc["iterations"]),
+        ).where(
+            DishImageQuery.id == query_id,
+            func.jsonb_typeof(doc["iterations"]) == "array",
+        )
+    ).first()
+    if row is None:
+        return None
+
+    current_idx = int(row[0] or 1) - 1
+    if not 0 <= current_idx < row[1]:
+        return False
+
+    db.execute(_metadata_patch_statement(query_id, current_idx, patch))
+    return True
+
+
+def _metadata_patch_statement(query_id: int, current_idx: int, patch: Dict[str, Any]):
+    """`UPDATE` merging `patch` into `result_gemini #> {iterations,<idx>,metadata}`."""
+    doc = cast(DishImageQuery.result_gemini, JSONB)
+    path = literal(["iterations", str(current_idx), "metadata"], ARRAY(Text))
+    current = doc.op("#>")(path)
+    # Merge only into an object: `'null'::jsonb || '{...}'` (a stored JSON
+    # null) would build an array rather than a metadata object.
+    base = case(
+        (func.jsonb_typeof(current) == "object", current),
+        else_=literal({}, JSONB),
+    )
+    merged = base.op("||")(literal(patch, JSONB))
+    return (
+        update(DishImageQuery)
+        .where(DishImageQuery.id == query_id)
+        .values(result_gemini=func.jsonb_set(doc, path, merged))
+    )
 
 
 def get_latest_iterations(record_id: int, limit: int = 3) -> List[Dict[str, Any]]:
@@ -230,24 +300,7 @@ def get_latest_iterations(record_id: int, limit: int = 3) -> List[Dict[str, Any]
     # Handle legacy format
     if "iterations" not in query.result_gemini:
         # Return single iteration
-        return [
-            {
-                "iteration_number": 1,
-                "created_at": (
-                    query.created_at.isoformat()
-                    if query.created_at
-                    else datetime.now(timezone.utc).isoformat()
-                ),
-                "user_feedback": None,
-                "metadata": {
-                    "selected_dish": query.result_gemini.get("dish_name", "Unknown"),
-                    "selected_serving_size": None,
-                    "number_of_servings": 1.0,
-                    "metadata_modified": False,
-                },
-                "analysis": query.result_gemini,
-            }
-        ]
+        return [_legacy_iteration(query)]
 
     # Get iterations (most recent first)
     iterations = query.result_gemini.get("iterations", [])
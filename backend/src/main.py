@@ -12,10 +12,12 @@ import os
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
 from src import models
+from src.api._json_response import FastJSONResponse
 from src.api.api_router import api_router
 from src.configs import IMAGE_DIR, settings
 from src.database import engine
@@ -25,16 +27,39 @@ def configure_logging():
     """
     Configure application logging.
 
-    Sets up both console and file logging with appropriate formatting
-    for debugging and monitoring purposes.
+    Sets up console logging, plus file logging when `LOG_FILE` names a
+    path, with appropriate formatting for debugging and monitoring
+    purposes. No-op when the root logger
+    already has handlers, so a re-import (tests, uvicorn `--reload`)
+    does not stack duplicate handlers and double every log write.
+
+    The level comes from `LOG_LEVEL` (default INFO); above DEBUG the
+    analyzers' %-style debug calls are dropped before any formatting.
     """
+    if logging.getLogger().hasHandlers():
+        return
+    # The format never shows thread/process fields; skip collecting them per record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    handlers = [logging.StreamHandler()]
+    # Opt-in: importing the app (tests, tools) must not create log files.
+    log_file = os.getenv("LOG_FILE")
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
     logging.basicConfig(
-        level=logging.INFO,
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
         format=("%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-        handlers=[logging.StreamHandler(), logging.FileHandler("app.log", encoding="utf-8")],
+        handlers=handlers,
     )
 
 
+# Environment and logging are process-wide; set them up once at import
+# rather than on every create_app() call.
+load_dotenv()
+configure_logging()
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -42,11 +67,6 @@ def create_app() -> FastAPI:
     Returns:
         FastAPI: Configured FastAPI application instance
     """
-    # Load environment variables from .env file
-    load_dotenv()
-
-    # Configure logging
-    configure_logging()
     logger = logging.getLogger(__name__)
     logger.info("Initializing Dish Healthiness application...")
 
@@ -59,6 +79,7 @@ def create_app() -> FastAPI:
         title=settings.PROJECT_NAME,
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url="/api-docs",
+        default_response_class=FastJSONResponse,
     )
 
     # Add session middleware for cookie-based authentication
@@ -94,6 +115,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress JSON responses (dish lists carry large analysis blobs).
+    # Added last so it wraps the other middleware; small bodies skip it.
+    fastapi_app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Mount static files directory for serving images
     fastapi_app.mount("/images", StaticFiles(directory=str(IMAGE_DIR)), name="images")
     logger.info("Mounted static files at /images -> %s", IMAGE_DIR)
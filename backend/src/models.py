@@ -5,7 +5,9 @@ This module defines SQLAlchemy ORM models for the food healthiness
 application, including user management and food image query storage.
 """
 
-from typing import Any, Dict
+import functools
+import operator
+from typing import Any, Callable, Dict, Tuple
 
 from sqlalchemy import (
     Column,
@@ -16,11 +18,32 @@ from sqlalchemy import (
     Integer,
     JSON,
     String,
+    Table,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 
 from src.database import Base
 
+# JSONB on Postgres (binary, jsonb operators); JSON elsewhere for the SQLite tests.
+JSONB_OR_JSON = JSON().with_variant(JSONB(), "postgresql")
+
+
+@functools.lru_cache(maxsize=None)
+def _column_getter(table: Table) -> Tuple[Tuple[str, ...], Callable[[Any], tuple]]:
+    """Column names of `table` and a getter returning their values as a tuple."""
+    names = tuple(column.name for column in table.columns)
+    if len(names) == 1:
+        # attrgetter with one name returns the bare value, not a 1-tuple.
+        return names, lambda row: (getattr(row, names[0]),)
+    return names, operator.attrgetter(*names)
+
+
+def _row_to_dict(row: Any) -> Dict[str, Any]:
+    """Column name -> value, with the per-table getter built once."""
+    names, getter = _column_getter(row.__table__)
+    return dict(zip(names, getter(row)))
+
 
 class Users(Base):
     """
@@ -59,7 +82,7 @@ class Users(Base):
         Returns:
             Dict[str, Any]: Dictionary containing all user attributes
         """
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        return _row_to_dict(self)
 
 
 class DishImageQuery(Base):
@@ -75,7 +98,6 @@ class DishImageQuery(Base):
         image_url (str): URL path to the uploaded image
         result_openai (dict): OpenAI analysis results (Flow 2)
         result_gemini (dict): Gemini analysis results (Flow 3)
-        meal_type (str): Type of meal (breakfast, lunch, dinner, snack)
         created_at (datetime): Timestamp when record was created
         target_date (datetime): Date when the dish was actually consumed
     """
@@ -85,12 +107,21 @@ class DishImageQuery(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     image_url = Column(String, nullable=True, default=None)
-    result_openai = Column(JSON, nullable=True, default=None)
-    result_gemini = Column(JSON, nullable=True, default=None)
+    result_openai = Column(JSONB_OR_JSON, nullable=True, default=None)
+    result_gemini = Column(JSONB_OR_JSON, nullable=True, default=None)
     dish_position = Column(Integer, nullable=True, default=None)
     created_at = Column(DateTime, nullable=False)
     target_date = Column(DateTime, nullable=True, default=None)
 
+    __table_args__ = (
+        Index(
+            "idx_dish_image_query_prod_dev_user_created_id",
+            user_id,
+            created_at.desc(),
+            id.desc(),
+        ),
+    )
+
     def __repr__(self) -> str:
         """
         Return string representation of dish image query.
@@ -107,7 +138,7 @@ class DishImageQuery(Base):
         Returns:
             Dict[str, Any]: Dictionary containing all query attributes
         """
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        return _row_to_dict(self)
 
 
 class PersonalizedFoodDescription(Base):
@@ -172,7 +203,7 @@ class PersonalizedFoodDescription(Base):
         Returns:
             Dict[str, Any]: Dictionary containing all row attributes
         """
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        return _row_to_dict(self)
 
 
 class NutritionFood(Base):
@@ -232,7 +263,7 @@ class NutritionFood(Base):
         Returns:
             Dict[str, Any]: Dictionary containing all row attributes
         """
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        return _row_to_dict(self)
 
 
 class NutritionMyfcdNutrient(Base):
@@ -275,4 +306,4 @@ class NutritionMyfcdNutrient(Base):
         Returns:
             Dict[str, Any]: Dictionary containing all row attributes
         """
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        return _row_to_dict(self)
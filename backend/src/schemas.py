@@ -8,7 +8,7 @@ and serialization in the food healthiness application API endpoints.
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Token(BaseModel):
@@ -68,10 +68,9 @@ class UserResponse(UserBase):
 
     id: int
 
-    class Config:
-        """Pydantic configuration for ORM mode compatibility."""
-
-        from_attributes = True
+    # ORM mode; read-only once built. extra="ignore", validate_assignment=False
+    # and revalidate_instances="never" are already the Pydantic v2 defaults.
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DishImageQueryBase(BaseModel):
@@ -123,10 +122,9 @@ class DishImageQueryResponse(DishImageQueryBase):
     created_at: Optional[datetime] = None
     target_date: Optional[datetime] = None
 
-    class Config:
-        """Pydantic configuration for ORM mode compatibility."""
-
-        from_attributes = True
+    # ORM mode; read-only once built. extra="ignore", validate_assignment=False
+    # and revalidate_instances="never" are already the Pydantic v2 defaults.
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class MetadataUpdate(BaseModel):
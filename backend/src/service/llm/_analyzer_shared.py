@@ -1,18 +1,82 @@
 """
 Shared helpers for the two Gemini analyzer modules.
 
-`enrich_result_with_metadata` is called by both
-`identification_analyzer.analyze_component_identification_async` and
-`nutrition_analyzer.analyze_nutritional_analysis_async` to stamp model /
-price / timing metadata onto the parsed response. Keeping it here avoids
-duplicating the logic across the two analyzer modules.
+`enrich_result_with_metadata` is called by
+`_structured_analyzer.analyze_structured_async` (the shared body of
+Component Identification and Nutritional Analysis) to stamp model /
+price / timing metadata onto the parsed response.
+
+`get_gemini_client` hands out one `genai.Client` per API key for the
+life of the process, so its underlying HTTP connection pool (and TLS
+session) is reused across calls instead of rebuilt for every request.
+
+`response_to_dict` turns the SDK's already-validated `response.parsed`
+into the plain dict both analyzers persist.
+
+`load_image_part` caches the query image's `types.Part`: the upload
+flow reads the same JPEG for the fast caption and Step 1, and Step 2
+reads it again after confirmation. With `GEMINI_FILE_UPLOADS=1`,
+`gemini_image_part` goes one step further and uploads that JPEG once via
+the Files API, so the three calls reference it by URI instead of each
+re-sending the bytes inline.
+
+`run_gemini_call` is the single dispatch point for the blocking
+`generate_content` calls (both analyzers plus `fast_caption`). Every
+upload runs its own background task, so concurrent users fan out
+naturally; the helper caps how many Gemini calls are in flight at once
+and retries transient (5xx / 429) failures with jittered exponential
+backoff.
 """
 
+import asyncio
+import functools
+import logging
+import os
+import random
+import threading
 import time
-from typing import Any, Dict
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, TypeVar, Union
+
+from google import genai  # pylint: disable=no-name-in-module
+from google.genai import errors, types  # pylint: disable=import-error,no-name-in-module
+import pydantic_core
+from pydantic import BaseModel
 
 from src.service.llm.pricing import compute_price_usd
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "16"))
+GEMINI_WORKERS = int(os.getenv("GEMINI_WORKERS", str(GEMINI_MAX_CONCURRENCY)))
+GEMINI_MAX_ATTEMPTS = 3
+GEMINI_BACKOFF_BASE_S = 1.0
+GEMINI_BACKOFF_MAX_S = 30.0
+IMAGE_PART_CACHE_SIZE = 16
+GEMINI_FILE_UPLOADS = os.getenv("GEMINI_FILE_UPLOADS", "0") == "1"
+# Files API handles live 48h; re-upload rather than reuse one about to lapse.
+UPLOADED_FILE_MIN_TTL = timedelta(hours=1)
+UPLOADED_FILE_CACHE_SIZE = 256
+
+# Blocking generate_content calls get their own threads, so a burst of
+# Gemini calls never queues the to_thread image reads behind it (or vice
+# versa) in the shared default executor. Threads start lazily on submit.
+_GEMINI_POOL = ThreadPoolExecutor(max_workers=GEMINI_WORKERS, thread_name_prefix="gemini")
+
+_uploaded_files: Dict[Tuple[int, str, int, int], types.File] = {}
+_uploaded_files_lock = threading.Lock()
+
+# asyncio.Semaphore binds to the loop it first waits on; key one per loop so
+# separate loops (tests use asyncio.run per case) never share a semaphore.
+_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def enrich_result_with_metadata(
     result: Dict[str, Any], model: str, analysis_start_time: float
@@ -44,3 +108,151 @@ def enrich_result_with_metadata(
     result["analysis_time"] = round(time.time() - analysis_start_time, 3)
 
     return result
+
+
+def response_to_dict(response: Any) -> Dict[str, Any]:
+    """
+    Return a structured Gemini response as a plain dict.
+
+    The SDK has already validated `response.parsed` against the request's
+    `response_schema`, so it is dumped through the class's compiled
+    serializer (built once at class creation, so no per-call schema work)
+    with warnings off. Falls back to decoding `response.text` with
+    pydantic-core's Rust JSON parser (same result as `json.loads`, fewer
+    Python-level allocations) when the SDK could not populate `parsed`.
+    """
+    parsed = response.parsed
+    if not parsed:
+        return pydantic_core.from_json(response.text)
+    if isinstance(parsed, BaseModel):
+        return type(parsed).__pydantic_serializer__.to_python(parsed, warnings=False)
+    return parsed.model_dump()
+
+
+@functools.lru_cache(maxsize=4)
+def get_gemini_client(api_key: str) -> genai.Client:
+    """
+    Return the process-wide `genai.Client` for `api_key`.
+
+    Keyed by key so a rotated `GEMINI_API_KEY` gets a fresh client.
+    Cleared in forked children, which must not share the parent's sockets.
+    """
+    return genai.Client(api_key=api_key)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=get_gemini_client.cache_clear)
+
+
+@functools.lru_cache(maxsize=IMAGE_PART_CACHE_SIZE)
+def _load_image_part_cached(  # pylint: disable=unused-argument
+    path: str, mtime_ns: int, size: int
+) -> types.Part:
+    # mtime_ns / size are cache-key only: a rewritten file misses the cache.
+    with open(path, "rb") as image_file:
+        return types.Part.from_bytes(data=image_file.read(), mime_type="image/jpeg")
+
+
+def load_image_part(image_path: Union[str, Path]) -> types.Part:
+    """
+    Return the JPEG at `image_path` as a Gemini `types.Part`.
+
+    Raises:
+        FileNotFoundError: If `image_path` does not resolve on disk
+    """
+    stat = os.stat(image_path)
+    return _load_image_part_cached(str(image_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _usable(uploaded: types.File) -> bool:
+    expires = uploaded.expiration_time
+    return expires is None or expires - datetime.now(timezone.utc) > UPLOADED_FILE_MIN_TTL
+
+
+def gemini_image_part(client: genai.Client, image_path: Union[str, Path]) -> types.Part:
+    """
+    Return the JPEG at `image_path` as a Files-API URI part, uploading once.
+
+    Opt-in via `GEMINI_FILE_UPLOADS=1`; otherwise, or when the upload
+    fails, falls back to the inline `load_image_part`.
+
+    Raises:
+        FileNotFoundError: If `image_path` does not resolve on disk
+    """
+    stat = os.stat(image_path)
+    if not GEMINI_FILE_UPLOADS:
+        return load_image_part(image_path)
+
+    key = (id(client), str(image_path), stat.st_mtime_ns, stat.st_size)
+    with _uploaded_files_lock:
+        uploaded = _uploaded_files.get(key)
+    if uploaded is None or not _usable(uploaded):
+        try:
+            uploaded = client.files.upload(
+                file=str(image_path), config=types.UploadFileConfig(mime_type="image/jpeg")
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("Gemini file upload failed for %s; sending inline: %s", image_path, exc)
+            return load_image_part(image_path)
+        with _uploaded_files_lock:
+            if len(_uploaded_files) >= UPLOADED_FILE_CACHE_SIZE:
+                _uploaded_files.pop(next(iter(_uploaded_files)))
+            _uploaded_files[key] = uploaded
+
+    return types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type or "image/jpeg")
+
+
+def _gemini_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+        _SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Server errors and rate limits are worth retrying; other 4xx are not."""
+    if isinstance(exc, errors.ServerError):
+        return True
+    return isinstance(exc, errors.ClientError) and exc.code == 429
+
+
+async def run_gemini_call(sync_call: Callable[[], T]) -> T:
+    """
+    Run a blocking Gemini SDK call on the dedicated Gemini thread pool.
+
+    At most `GEMINI_MAX_CONCURRENCY` calls are in flight per event loop.
+    Transient failures are retried up to `GEMINI_MAX_ATTEMPTS` times with
+    jittered exponential backoff (uniform in [0, 1s], [0, 2s], ... capped
+    at `GEMINI_BACKOFF_MAX_S`) so calls that hit the same 429 together do
+    not retry in lockstep; anything else propagates unchanged.
+
+    Args:
+        sync_call: Zero-argument callable wrapping `generate_content`
+
+    Returns:
+        The SDK response returned by `sync_call`
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(GEMINI_MAX_ATTEMPTS - 1):
+        try:
+            async with _gemini_semaphore():
+                return await loop.run_in_executor(_GEMINI_POOL, sync_call)
+        except (errors.ClientError, errors.ServerError) as exc:
+            if not _is_transient(exc):
+                raise
+            delay = random.uniform(
+                0, min(GEMINI_BACKOFF_MAX_S, GEMINI_BACKOFF_BASE_S * 2**attempt)
+            )
+            logger.warning(
+                "Transient Gemini error (attempt %s/%s), retrying in %.1fs: %s",
+                attempt + 1,
+                GEMINI_MAX_ATTEMPTS,
+                delay,
+                exc,
+            )
+            await asyncio.sleep(delay)
+
+    async with _gemini_semaphore():
+        return await loop.run_in_executor(_GEMINI_POOL, sync_call)
@@ -12,6 +12,7 @@ Static prose for each block lives under
 substitutes the trimmed JSON payload at the `{{PAYLOAD_JSON}}` slot.
 """
 
+import functools
 import json
 from typing import Any, Dict, List, Optional
 
@@ -25,8 +26,14 @@ _BLOCKS_DIR = RESOURCE_DIR / "prompts" / "blocks"
 _PAYLOAD_PLACEHOLDER = "{{PAYLOAD_JSON}}"
 
 
+@functools.lru_cache(maxsize=None)
 def _load_block_template(filename: str) -> str:
-    """Load a prompt-block template from `backend/resources/prompts/blocks/`."""
+    """
+    Load a prompt-block template from `backend/resources/prompts/blocks/`.
+
+    Read once per process; templates are static resources, so an edit
+    needs a restart to take effect.
+    """
     path = _BLOCKS_DIR / filename
     if not path.exists():
         raise FileNotFoundError(f"Prompt block template not found: {path}")
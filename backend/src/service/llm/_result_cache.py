@@ -0,0 +1,112 @@
+"""
+In-process result cache for the Gemini Pro analyzers.
+
+Component Identification and Nutritional Analysis are pure functions of
+(image bytes, prompt text, model, thinking budget, reference image):
+temperature is 0 and every per-dish input — confirmed components,
+personalization matches, reference priors — is rendered into the prompt.
+A re-upload of the same photo or a retry with identical inputs can
+therefore reuse the earlier result instead of paying for another
+multi-second Pro call.
+
+Entries live in a bounded LRU with a TTL (`GEMINI_RESULT_CACHE_TTL_S`,
+default 24h; 0 disables). The cache is per process and is not shared
+across workers; there is no Redis in this deployment. A hit is returned
+through `as_cache_hit`, which zeroes the token and price fields (no call
+was billed), re-times the request and sets `cache_hit`.
+"""
+
+import copy
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+RESULT_CACHE_SIZE = 128
+RESULT_CACHE_TTL_S = int(os.getenv("GEMINI_RESULT_CACHE_TTL_S", str(24 * 3600)))
+
+_results: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_image_digests: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+# `_image_digest` runs in `asyncio.to_thread` workers, so concurrent calls
+# can touch `_image_digests` at once.
+_image_digests_lock = threading.Lock()
+
+
+def _image_digest(image_path: Union[str, Path]) -> bytes:
+    stat = os.stat(image_path)
+    key = (str(image_path), stat.st_mtime_ns, stat.st_size)
+    with _image_digests_lock:
+        digest = _image_digests.get(key)
+    if digest is None:
+        with open(image_path, "rb") as image_file:
+            digest = hashlib.blake2b(image_file.read(), digest_size=16).digest()
+        with _image_digests_lock:
+            _image_digests[key] = digest
+            if len(_image_digests) > RESULT_CACHE_SIZE:
+                _image_digests.popitem(last=False)
+    return digest
+
+
+def result_cache_key(image_path: Union[str, Path], *inputs: Union[str, bytes, None]) -> str:
+    """
+    Hash the image contents plus every other call input into a cache key.
+
+    Reads the image (once per path/mtime/size), so call it off the loop.
+
+    Raises:
+        FileNotFoundError: If `image_path` does not resolve on disk
+    """
+    hasher = hashlib.blake2b(_image_digest(image_path), digest_size=16)
+    for value in inputs:
+        hasher.update(b"\x00")
+        if value is not None:
+            hasher.update(value.encode("utf-8") if isinstance(value, str) else value)
+    return hasher.hexdigest()
+
+
+def get_cached_result(key: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of a fresh cached result, or None."""
+    entry = _results.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at > RESULT_CACHE_TTL_S:
+        del _results[key]
+        return None
+    _results.move_to_end(key)
+    return copy.deepcopy(result)
+
+
+def as_cache_hit(result: Dict[str, Any], analysis_start_time: float) -> Dict[str, Any]:
+    """
+    Stamp a cached result as served from cache rather than from Gemini.
+
+    Token counts and `price_usd` are zeroed since nothing was billed, and
+    `analysis_time` is measured from `analysis_start_time` (time.time()).
+    """
+    result["input_token"] = 0
+    result["output_token"] = 0
+    result["price_usd"] = 0.0
+    result["analysis_time"] = round(time.time() - analysis_start_time, 3)
+    result["cache_hit"] = True
+    return result
+
+
+def put_cached_result(key: str, result: Dict[str, Any]) -> None:
+    """Store a copy of `result`; evicts the least recently used entry."""
+    if RESULT_CACHE_TTL_S <= 0:
+        return
+    _results[key] = (time.monotonic(), copy.deepcopy(result))
+    _results.move_to_end(key)
+    if len(_results) > RESULT_CACHE_SIZE:
+        _results.popitem(last=False)
+
+
+def clear_result_cache() -> None:
+    """Drop every cached result (tests, or after a prompt deploy)."""
+    _results.clear()
+    with _image_digests_lock:
+        _image_digests.clear()
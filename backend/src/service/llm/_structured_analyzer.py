@@ -0,0 +1,197 @@
+"""
+Shared body of the two Gemini Pro analyzers.
+
+Component Identification (Phase 1.1.2) and Nutritional Analysis
+(Phase 2.3) make the same call: one prompt, the query image, an optional
+reference image, a structured `response_schema`, and temperature 0. They
+differ only in the schema, the log / error label, and which top-level
+fields the parsed result must carry. `analyze_structured_async` holds the
+single implementation; the public analyzer functions are thin wrappers
+that pin those three inputs.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Type
+
+from google.genai import types  # pylint: disable=import-error,no-name-in-module
+from pydantic import BaseModel
+
+from src.service.llm._analyzer_shared import (
+    enrich_result_with_metadata,
+    gemini_image_part,
+    get_gemini_client,
+    response_to_dict,
+    run_gemini_call,
+)
+from src.service.llm._result_cache import (
+    as_cache_hit,
+    get_cached_result,
+    put_cached_result,
+    result_cache_key,
+)
+from src.service.llm.pricing import extract_token_usage
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=16)
+def _generation_config(
+    schema: Type[BaseModel], thinking_budget: int
+) -> types.GenerateContentConfig:
+    """
+    Request config for one (schema, thinking budget) pair, built once.
+
+    Shared across calls and retries; the SDK copies the config before use.
+    """
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=schema,
+        temperature=0,
+        thinking_config=types.ThinkingConfig(thinking_budget=thinking_budget),
+    )
+
+
+def _cached_result(
+    cache_key: str, schema: Type[BaseModel], analysis_start_time: float
+) -> Optional[Dict[str, Any]]:
+    """Earlier result for identical inputs, stamped as a cache hit, or None."""
+    cached = get_cached_result(cache_key)
+    if cached is None:
+        return None
+    logger.info("[Gemini] Reusing cached %s result", schema.__name__)
+    return as_cache_hit(cached, analysis_start_time)
+
+
+def _require_fields(result: Dict[str, Any], required_fields: Sequence[str], step_label: str):
+    """
+    Raise if the parsed response lacks a top-level field.
+
+    Raises:
+        ValueError: Naming the first missing field
+    """
+    for field in required_fields:
+        if field not in result:
+            raise ValueError(f"{step_label} response missing required field: {field}")
+
+
+# pylint: disable=too-many-arguments
+async def analyze_structured_async(  # pylint: disable=too-many-locals
+    *,
+    step_label: str,
+    schema: Type[BaseModel],
+    required_fields: Sequence[str],
+    image_path: Path,
+    analysis_prompt: str,
+    gemini_model: str,
+    thinking_budget: int,
+    reference_image_bytes: Optional[bytes] = None,
+) -> Dict[str, Any]:
+    """
+    Run one structured Gemini call over the query image (plus reference).
+
+    Args:
+        step_label: Human-readable step name for logs and error messages
+        schema: Pydantic model passed as the request's `response_schema`
+        required_fields: Top-level keys the parsed result must contain
+        image_path: Path to the food dish image file
+        analysis_prompt: Fully rendered prompt text
+        gemini_model: Gemini model to use
+        thinking_budget: Thinking budget for Gemini
+        reference_image_bytes: Optional JPEG bytes attached after the query
+            image. When None, the request is single-image.
+
+    Returns:
+        Dict[str, Any]: Parsed result with token usage and metadata
+
+    Raises:
+        FileNotFoundError: If `image_path` does not resolve on disk
+        ValueError: If the API key is missing, the call fails, or the
+            response lacks a required field
+    """
+    analysis_start_time = time.time()
+
+    # Validate API key
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY environment variable is required")
+
+    # Initialize client
+    client = get_gemini_client(api_key)
+
+    try:
+        # Identical inputs (photo, prompt, model, reference) reuse the earlier result
+        cache_key = await asyncio.to_thread(
+            result_cache_key,
+            image_path,
+            schema.__name__,
+            analysis_prompt,
+            gemini_model,
+            str(thinking_budget),
+            reference_image_bytes,
+        )
+        cached = _cached_result(cache_key, schema, analysis_start_time)
+        if cached is not None:
+            return cached
+
+        # Upload once off the event loop; caption / Step 1 / Step 2 share the URI
+        image_part = await asyncio.to_thread(gemini_image_part, client, image_path)
+
+        # Order matters: the query image must land at index 1 so the prompts'
+        # "image attached after the query image is the prior dish" framing
+        # is accurate; the reference image (if any) goes at index 2.
+        contents = [analysis_prompt, image_part]
+        if reference_image_bytes is not None:
+            contents.append(
+                types.Part.from_bytes(data=reference_image_bytes, mime_type="image/jpeg")
+            )
+
+        logger.info(
+            "[Gemini %s] Using model: %s with thinking_budget: %s image_parts: %s",
+            step_label,
+            gemini_model,
+            thinking_budget,
+            len(contents) - 1,
+        )
+
+        config = _generation_config(schema, thinking_budget)
+
+        def _sync_gemini_call():
+            return client.models.generate_content(
+                model=gemini_model, contents=contents, config=config
+            )
+
+        response = await run_gemini_call(_sync_gemini_call)
+        # Never format the whole response: its repr walks every candidate/part.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[Gemini %s] Response received: usage=%s text_len=%s",
+                step_label,
+                response.usage_metadata,
+                len(response.text or ""),
+            )
+
+        # Parse response (falls back to response.text when parsed is empty)
+        result = response_to_dict(response)
+
+        _require_fields(result, required_fields, step_label)
+
+        # Extract token usage
+        input_tok, output_tok = extract_token_usage(response, "gemini")
+        result["input_token"] = input_tok
+        result["output_token"] = output_tok
+
+        # Enrich with metadata
+        result = enrich_result_with_metadata(result, gemini_model, analysis_start_time)
+
+        put_cached_result(cache_key, result)
+        return result
+
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Error calling Gemini API ({step_label}): {e}") from e
@@ -12,18 +12,29 @@ and nowhere else in Stage 2.
 """
 
 import asyncio
+import functools
 import os
 from pathlib import Path
 from typing import Union
 
-from google import genai  # pylint: disable=no-name-in-module
 from google.genai import types  # pylint: disable=import-error,no-name-in-module
 
 from src.configs import RESOURCE_DIR
+from src.service.llm._analyzer_shared import (
+    gemini_image_part,
+    get_gemini_client,
+    run_gemini_call,
+)
 
 _CAPTION_PROMPT_PATH = RESOURCE_DIR / "prompts" / "fast_caption.md"
+# Built once; the SDK copies the config before each request.
+_CAPTION_CONFIG = types.GenerateContentConfig(
+    temperature=0,
+    thinking_config=types.ThinkingConfig(thinking_budget=0),
+)
 
 
+@functools.lru_cache(maxsize=1)
 def _load_caption_instructions() -> str:
     if not _CAPTION_PROMPT_PATH.exists():
         raise FileNotFoundError(
@@ -47,33 +58,26 @@ async def generate_fast_caption_async(image_path: Union[str, Path]) -> str:
         ValueError: If GEMINI_API_KEY is missing, the API call fails, or
             the response carries no text payload.
         FileNotFoundError: If `image_path` does not resolve on disk
-            (propagates from the `open()` call unchanged).
+            (propagates from `gemini_image_part` unchanged).
     """
     api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
         raise ValueError("GEMINI_API_KEY environment variable is required")
 
-    client = genai.Client(api_key=api_key)
+    client = get_gemini_client(api_key)
 
     try:
-        with open(image_path, "rb") as image_file:
-            image_bytes = image_file.read()
-
-        image_part = types.Part.from_bytes(data=image_bytes, mime_type="image/jpeg")
-
-        loop = asyncio.get_event_loop()
+        # Upload once off the event loop; caption / Step 1 / Step 2 share the URI
+        image_part = await asyncio.to_thread(gemini_image_part, client, image_path)
 
         def _sync_gemini_call():
             return client.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=[_load_caption_instructions(), image_part],
-                config=types.GenerateContentConfig(
-                    temperature=0,
-                    thinking_config=types.ThinkingConfig(thinking_budget=0),
-                ),
+                config=_CAPTION_CONFIG,
             )
 
-        response = await loop.run_in_executor(None, _sync_gemini_call)
+        response = await run_gemini_call(_sync_gemini_call)
 
         text = (response.text or "").strip() if hasattr(response, "text") else ""
         if not text:
@@ -0,0 +1,33 @@
+"""
+Base class for Gemini `response_schema` models.
+
+The Gemini SDK calls `model_json_schema()` on the `response_schema` class
+for every `generate_content` request, and Pydantic regenerates the schema
+from scratch each time (~1 ms for the nested response models). The
+schema is fixed per class, so build it once and hand out deep copies —
+the SDK rewrites the dict it receives in place. Instances are frozen:
+a parsed response is only ever read and then copied into a dict.
+"""
+
+import copy
+from typing import Any, Dict
+
+from pydantic import BaseModel, ConfigDict
+
+_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+
+
+class CachedSchemaModel(BaseModel):
+    """BaseModel whose default-argument `model_json_schema()` is memoized."""
+
+    # Parsed responses are read-only values; unknown keys are dropped.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        if args or kwargs:
+            return super().model_json_schema(*args, **kwargs)
+        schema = _SCHEMA_CACHE.get(cls)
+        if schema is None:
+            schema = _SCHEMA_CACHE[cls] = super().model_json_schema()
+        return copy.deepcopy(schema)
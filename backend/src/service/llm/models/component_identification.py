@@ -4,13 +4,14 @@ Pydantic model for the Component Identification response (Phase 1.1.2).
 
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from src.service.llm.models.cached_schema_model import CachedSchemaModel
 from src.service.llm.models.component_serving_prediction import ComponentServingPrediction
 from src.service.llm.models.dish_name_prediction import DishNamePrediction
 
 
-class ComponentIdentification(BaseModel):
+class ComponentIdentification(CachedSchemaModel):
     """
     Component Identification: individual dish identification and serving size predictions.
 
@@ -4,7 +4,7 @@ Pydantic model for a single Step 1 individual-dish serving-size prediction.
 
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ComponentServingPrediction(BaseModel):
@@ -21,6 +21,8 @@ class ComponentServingPrediction(BaseModel):
         predicted_servings (float): Estimated number of servings for this dish
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     component_name: str = Field(
         ..., description="Name of the individual dish (complete item, not ingredients)"
     )
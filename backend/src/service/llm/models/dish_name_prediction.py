@@ -2,7 +2,7 @@
 Pydantic model for a single Step 1 dish-name prediction.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DishNamePrediction(BaseModel):
@@ -14,5 +14,7 @@ class DishNamePrediction(BaseModel):
         confidence (float): Confidence score between 0.0 and 1.0
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str = Field(..., description="Predicted dish name")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score between 0 and 1")
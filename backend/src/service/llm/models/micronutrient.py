@@ -4,7 +4,7 @@ Pydantic model for a single micronutrient entry in Step 2 output.
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Micronutrient(BaseModel):
@@ -16,6 +16,8 @@ class Micronutrient(BaseModel):
     strings are still tolerated by the frontend (see NutritionResults.jsx).
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str = Field(..., description="Nutrient name, e.g. 'Vitamin C', 'Iron'")
     amount_mg: Optional[float] = Field(
         default=None, ge=0, description="Quantity in milligrams, if known"
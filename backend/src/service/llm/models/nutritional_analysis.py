@@ -4,12 +4,13 @@ Pydantic model for the Nutritional Analysis response (Phase 2.3).
 
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from src.service.llm.models.cached_schema_model import CachedSchemaModel
 from src.service.llm.models.micronutrient import Micronutrient
 
 
-class NutritionalAnalysis(BaseModel):
+class NutritionalAnalysis(CachedSchemaModel):
     """
     Nutritional Analysis: detailed nutrient estimation.
 
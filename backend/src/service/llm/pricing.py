@@ -8,8 +8,9 @@ Pricing is per 1 million tokens (input and output separately).
 Prices are in USD.
 """
 
+import functools
 import logging
-from typing import Any, Set, Tuple
+from typing import Any, Dict, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,46 @@ PRICING = {
 DEFAULT_PRICING = {"input": 0.075, "output": 0.30}
 
 
-# pylint: disable=too-many-return-statements
+def _per_token(pricing: Dict[str, float]) -> Tuple[float, float, float]:
+    """(input, output, cached_input) USD per single token; no cached rate -> 0."""
+    return (
+        pricing["input"] * 1e-6,
+        pricing["output"] * 1e-6,
+        pricing.get("cached_input", 0.0) * 1e-6,
+    )
+
+
+# Per-token rates folded once at import so each price is three multiplies.
+_PRICING_PER_TOKEN = {key: _per_token(pricing) for key, pricing in PRICING.items()}
+_DEFAULT_PER_TOKEN = _per_token(DEFAULT_PRICING)
+
+
+# Pricing key per vendor, as (model prefix, key), most specific prefix
+# first. The model strings in use match a prefix exactly, so
+# `_MODEL_ALIAS` answers them with one dict lookup and the prefix scan
+# only runs for dated or suffixed variants (e.g. "gemini-2.5-pro-002").
+_MODEL_PREFIXES = {
+    "openai": (
+        ("gpt-5-high", "gpt-5-high"),
+        ("gpt-5-medium", "gpt-5-medium"),
+        ("gpt-5-low", "gpt-5-low"),
+        ("gpt-5-mini", "gpt-5-low"),
+        ("gpt-5", "gpt-5"),
+    ),
+    "gemini": (
+        ("gemini-2.5-flash", "gemini-2.5-flash"),
+        ("gemini-2.5-pro", "gemini-2.5-pro"),
+        ("gemini-2.5", "gemini-2.5"),
+    ),
+}
+_DEFAULT_KEY = {"openai": "gpt-5", "gemini": "gemini-2.5"}
+_MODEL_ALIAS = {
+    (vendor, prefix): key for vendor, table in _MODEL_PREFIXES.items() for prefix, key in table
+}
+
+
+# (model, vendor) comes from a handful of configured names; memoize outright.
+@functools.lru_cache(maxsize=64)
 def normalize_model_key(model: str, vendor: str) -> str:
     """
     Normalize model string to a pricing key.
@@ -52,24 +92,14 @@ def normalize_model_key(model: str, vendor: str) -> str:
         Standardized key used for pricing tables.
     """
     key = (model or "").strip().lower()
-    if vendor == "openai":
-        if key.startswith("gpt-5-high"):
-            return "gpt-5-high"
-        if key.startswith("gpt-5-medium"):
-            return "gpt-5-medium"
-        if key.startswith("gpt-5-low") or key.startswith("gpt-5-mini"):
-            return "gpt-5-low"
-        if key.startswith("gpt-5"):
-            return "gpt-5"
-        return "gpt-5"
-    # gemini
-    if key.startswith("gemini-2.5-flash"):
-        return "gemini-2.5-flash"
-    if key.startswith("gemini-2.5-pro"):
-        return "gemini-2.5-pro"
-    if key.startswith("gemini-2.5"):
-        return "gemini-2.5"
-    return "gemini-2.5"
+    vendor = "openai" if vendor == "openai" else "gemini"
+    exact = _MODEL_ALIAS.get((vendor, key))
+    if exact is not None:
+        return exact
+    for prefix, pricing_key in _MODEL_PREFIXES[vendor]:
+        if key.startswith(prefix):
+            return pricing_key
+    return _DEFAULT_KEY[vendor]
 
 
 def compute_price_usd(
@@ -91,8 +121,8 @@ def compute_price_usd(
         float: Price in USD rounded to 4 decimals
     """
     key = normalize_model_key(model, vendor)
-    pricing = PRICING.get(key)
-    if pricing is None:
+    rates = _PRICING_PER_TOKEN.get(key)
+    if rates is None:
         # Cost numbers will be quietly wrong if we keep silently using the
         # cheapest defaults — log once per (vendor, key) so it shows up in
         # ops dashboards rather than rotting in the data.
@@ -107,18 +137,14 @@ def compute_price_usd(
                 key,
                 DEFAULT_PRICING,
             )
-        pricing = DEFAULT_PRICING
-
-    # Calculate cost (pricing is per 1 million tokens)
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
-
-    # Add cached input cost if applicable (OpenAI only)
-    cached_input_cost = 0
-    if cached_input_tokens > 0 and "cached_input" in pricing:
-        cached_input_cost = (cached_input_tokens / 1_000_000) * pricing["cached_input"]
-
-    total = input_cost + output_cost + cached_input_cost
+        rates = _DEFAULT_PER_TOKEN
+
+    input_rate, output_rate, cached_input_rate = rates
+    total = (
+        input_tokens * input_rate
+        + output_tokens * output_rate
+        + cached_input_tokens * cached_input_rate  # 0 rate unless OpenAI cached pricing
+    )
 
     # Round to 4 decimals for display consistency
     return round(total, 4)
@@ -5,11 +5,13 @@ This module provides functions for loading and formatting prompts
 for dish analysis.
 """
 
+import functools
 import re
 from typing import Any, Dict, List, Optional
 
 from src.configs import RESOURCE_DIR
 from src.service.llm._nutrition_blocks import (
+    _load_block_template,
     render_nutrition_db_block,
     render_personalized_block,
 )
@@ -38,16 +40,16 @@ _PERSONALIZED_STRIP_RE = re.compile(
 # ============================================================
 
 
-_BLOCKS_DIR = RESOURCE_DIR / "prompts" / "blocks"
-
+@functools.lru_cache(maxsize=None)
+def _load_prompt(filename: str) -> str:
+    """
+    Read a prompt from `backend/resources/prompts/` once per process.
 
-def _load_block_template(filename: str) -> str:
-    """Load a prompt-block template from `backend/resources/prompts/blocks/`."""
-    path = _BLOCKS_DIR / filename
-    if not path.exists():
-        raise FileNotFoundError(f"Prompt block template not found: {path}")
-    # rstrip trailing newlines only — preserve all internal whitespace.
-    return path.read_text(encoding="utf-8").rstrip("\n")
+    Prompts are static resources, so an edit needs a restart to take effect.
+    Callers format a copy; the cached string itself is never mutated.
+    """
+    with open(RESOURCE_DIR / "prompts" / filename, "r", encoding="utf-8") as f:
+        return f.read()
 
 
 def _render_reference_block(
@@ -123,12 +125,13 @@ def get_component_identification_prompt(
     Raises:
         FileNotFoundError: If step1 prompt file is not found
     """
-    prompt_path = RESOURCE_DIR / "prompts" / "component_identification.md"
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Step 1 component identification prompt not found: {prompt_path}")
-
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        prompt = f.read()
+    try:
+        prompt = _load_prompt("component_identification.md")
+    except FileNotFoundError as exc:
+        prompt_path = RESOURCE_DIR / "prompts" / "component_identification.md"
+        raise FileNotFoundError(
+            f"Step 1 component identification prompt not found: {prompt_path}"
+        ) from exc
 
     ref = reference or {}
     prior = ref.get("prior_identification_data")
@@ -191,12 +194,13 @@ def get_nutritional_analysis_prompt(
     Raises:
         FileNotFoundError: If step2 prompt file is not found
     """
-    prompt_path = RESOURCE_DIR / "prompts" / "nutritional_analysis.md"
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Step 2 nutritional analysis prompt not found: {prompt_path}")
-
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        base_prompt = f.read()
+    try:
+        base_prompt = _load_prompt("nutritional_analysis.md")
+    except FileNotFoundError as exc:
+        prompt_path = RESOURCE_DIR / "prompts" / "nutritional_analysis.md"
+        raise FileNotFoundError(
+            f"Step 2 nutritional analysis prompt not found: {prompt_path}"
+        ) from exc
 
     base_prompt = _substitute_or_strip(
         base_prompt,
@@ -12,14 +12,10 @@ test.
 # pylint: disable=redefined-outer-name,unused-argument
 
 import os
-import sys
-from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Dict, List
 
-# Make `src` importable as a top-level package, mirroring run_uvicorn.py.
-BACKEND_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(BACKEND_ROOT))
+# `src` is importable as a top-level package via `pythonpath = .` in pytest.ini.
 
 # Ensure modules that read env at import time get a reasonable default.
 # `src.database` raises at import without these; `src.auth` needs JWT_SECRET_KEY.
@@ -35,6 +31,18 @@ from fastapi import FastAPI  # noqa: E402
 from fastapi.testclient import TestClient  # noqa: E402
 
 from src.api.api_router import api_router  # noqa: E402
+from src.service.llm._analyzer_shared import get_gemini_client  # noqa: E402
+from src.service.llm._result_cache import clear_result_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _fresh_gemini_client():
+    """Tests patch `genai.Client`; never hand one test another's cached fake or result."""
+    get_gemini_client.cache_clear()
+    clear_result_cache()
+    yield
+    get_gemini_client.cache_clear()
+    clear_result_cache()
 
 
 @pytest.fixture()
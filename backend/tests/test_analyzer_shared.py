@@ -0,0 +1,213 @@
+"""
+Tests for src/service/llm/_analyzer_shared.py — `run_gemini_call` retry,
+concurrency bound, client reuse, the image-part cache and Files-API
+upload reuse, and response parsing.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+# pylint: disable=redefined-outer-name,unused-argument
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from google.genai import errors, types  # pylint: disable=import-error,no-name-in-module
+from pydantic import BaseModel
+
+from src.service.llm import _analyzer_shared
+
+
+@pytest.fixture()
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(_analyzer_shared, "GEMINI_BACKOFF_BASE_S", 0.0)
+
+
+def _flaky(failures):
+    calls = []
+
+    def _call():
+        calls.append(1)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return "ok"
+
+    return _call, calls
+
+
+def test_retries_server_errors_then_succeeds(no_backoff):
+    call, calls = _flaky([errors.ServerError(503, {}), errors.ClientError(429, {})])
+
+    assert asyncio.run(_analyzer_shared.run_gemini_call(call)) == "ok"
+    assert len(calls) == 3
+
+
+def test_non_transient_client_error_is_not_retried(no_backoff):
+    call, calls = _flaky([errors.ClientError(400, {})])
+
+    with pytest.raises(errors.ClientError):
+        asyncio.run(_analyzer_shared.run_gemini_call(call))
+    assert len(calls) == 1
+
+
+def test_gives_up_after_max_attempts(no_backoff):
+    call, calls = _flaky([errors.ServerError(500, {})] * 5)
+
+    with pytest.raises(errors.ServerError):
+        asyncio.run(_analyzer_shared.run_gemini_call(call))
+    assert len(calls) == _analyzer_shared.GEMINI_MAX_ATTEMPTS
+
+
+def test_backoff_is_jittered_and_capped(monkeypatch):
+    monkeypatch.setattr(_analyzer_shared, "GEMINI_BACKOFF_MAX_S", 1.5)
+    delays = []
+
+    async def _record_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(_analyzer_shared.asyncio, "sleep", _record_sleep)
+    call, _calls = _flaky([errors.ServerError(503, {})] * 2)
+
+    assert asyncio.run(_analyzer_shared.run_gemini_call(call)) == "ok"
+    assert len(delays) == 2
+    assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 1.5
+
+
+def test_in_flight_calls_are_capped(monkeypatch):
+    monkeypatch.setattr(_analyzer_shared, "GEMINI_MAX_CONCURRENCY", 2)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def _call():
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return "ok"
+
+    async def _fan_out():
+        return await asyncio.gather(*[_analyzer_shared.run_gemini_call(_call) for _ in range(6)])
+
+    assert asyncio.run(_fan_out()) == ["ok"] * 6
+    assert state["peak"] == 2
+
+
+def test_gemini_client_is_reused_per_api_key(monkeypatch):
+    built = []
+
+    def _client(api_key):
+        built.append(api_key)
+
+    monkeypatch.setattr(_analyzer_shared.genai, "Client", _client)
+
+    _analyzer_shared.get_gemini_client("key-a")
+    _analyzer_shared.get_gemini_client("key-a")
+    _analyzer_shared.get_gemini_client("key-b")
+
+    assert built == ["key-a", "key-b"]
+
+
+def test_image_part_is_cached_until_file_changes(tmp_path):
+    path = tmp_path / "dish.jpg"
+    path.write_bytes(b"v1")
+
+    first = _analyzer_shared.load_image_part(path)
+    assert _analyzer_shared.load_image_part(str(path)) is first
+
+    path.write_bytes(b"v2-longer")
+    assert _analyzer_shared.load_image_part(path) is not first
+
+
+class _Flat(BaseModel):
+    dish_name: str
+    healthiness_score: int
+
+
+class _Nested(BaseModel):
+    items: List[_Flat]
+
+
+def test_response_to_dict_dumps_flat_and_nested_models():
+    flat = _Flat(dish_name="Pho", healthiness_score=7)
+    nested = _Nested(items=[flat])
+
+    assert _analyzer_shared.response_to_dict(SimpleNamespace(parsed=flat)) == flat.model_dump()
+    assert _analyzer_shared.response_to_dict(SimpleNamespace(parsed=nested)) == {
+        "items": [{"dish_name": "Pho", "healthiness_score": 7}]
+    }
+
+
+def test_response_to_dict_falls_back_to_text():
+    response = SimpleNamespace(parsed=None, text='{"dish_name": "Pho"}')
+    assert _analyzer_shared.response_to_dict(response) == {"dish_name": "Pho"}
+
+
+class _FakeFiles:
+    def __init__(self, expires_in=timedelta(hours=47), fail=False):
+        self.uploads = []
+        self.expires_in = expires_in
+        self.fail = fail
+
+    def upload(self, *, file, config):
+        if self.fail:
+            raise errors.ServerError(503, {})
+        self.uploads.append(file)
+        return types.File(
+            uri=f"https://files.example/{len(self.uploads)}",
+            mime_type=config.mime_type,
+            expiration_time=datetime.now(timezone.utc) + self.expires_in,
+        )
+
+
+@pytest.fixture()
+def jpeg(tmp_path, monkeypatch):
+    monkeypatch.setattr(_analyzer_shared, "_uploaded_files", {})
+    monkeypatch.setattr(_analyzer_shared, "GEMINI_FILE_UPLOADS", True)
+    path = tmp_path / "dish.jpg"
+    path.write_bytes(b"jpeg-bytes")
+    return path
+
+
+def test_image_is_uploaded_once_and_referenced_by_uri(jpeg):
+    client = SimpleNamespace(files=_FakeFiles())
+
+    first = _analyzer_shared.gemini_image_part(client, jpeg)
+    second = _analyzer_shared.gemini_image_part(client, jpeg)
+
+    assert client.files.uploads == [str(jpeg)]
+    assert first.file_data.file_uri == second.file_data.file_uri == "https://files.example/1"
+    assert first.inline_data is None
+
+
+def test_handle_near_expiry_is_reuploaded(jpeg):
+    client = SimpleNamespace(files=_FakeFiles(expires_in=timedelta(minutes=5)))
+
+    _analyzer_shared.gemini_image_part(client, jpeg)
+    _analyzer_shared.gemini_image_part(client, jpeg)
+
+    assert len(client.files.uploads) == 2
+
+
+def test_failed_upload_falls_back_to_inline_bytes(jpeg):
+    client = SimpleNamespace(files=_FakeFiles(fail=True))
+
+    part = _analyzer_shared.gemini_image_part(client, jpeg)
+
+    assert part.file_data is None
+    assert part.inline_data.data == b"jpeg-bytes"
+
+
+def test_uploads_disabled_sends_inline_bytes(jpeg, monkeypatch):
+    monkeypatch.setattr(_analyzer_shared, "GEMINI_FILE_UPLOADS", False)
+    client = SimpleNamespace(files=_FakeFiles())
+
+    part = _analyzer_shared.gemini_image_part(client, jpeg)
+
+    assert client.files.uploads == []
+    assert part.inline_data.data == b"jpeg-bytes"
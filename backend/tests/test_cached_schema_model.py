@@ -0,0 +1,29 @@
+"""
+Tests for src/service/llm/models/cached_schema_model.py — memoized
+`model_json_schema()` on the Gemini response models.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+from pydantic import BaseModel
+
+from src.service.llm.models import ComponentIdentification, NutritionalAnalysis
+
+
+def test_cached_schema_matches_fresh_generation():
+    for model in (ComponentIdentification, NutritionalAnalysis):
+        fresh = BaseModel.model_json_schema.__func__(model)
+        assert model.model_json_schema() == fresh
+
+
+def test_mutating_a_returned_schema_does_not_leak_into_the_cache():
+    schema = NutritionalAnalysis.model_json_schema()
+    schema["properties"].clear()
+    schema.pop("$defs", None)
+
+    assert NutritionalAnalysis.model_json_schema()["properties"]
+
+
+def test_explicit_arguments_bypass_the_cache():
+    schema = ComponentIdentification.model_json_schema(mode="serialization")
+    assert schema["title"] == "ComponentIdentification"
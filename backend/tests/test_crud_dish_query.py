@@ -0,0 +1,185 @@
+"""
+Tests for the DishImageQuery CRUD modules (src/crud/dish_query_*.py).
+
+Uses an in-memory SQLite engine, mirroring test_crud_personalized_food.py:
+`SessionLocal` in each CRUD module is monkeypatched onto the SQLite-backed
+sessionmaker per test.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+# pylint: disable=redefined-outer-name,unused-argument,protected-access
+
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from src.crud import dish_query_basic, dish_query_filters, dish_query_iterations
+from src.database import Base
+from src.models import DishImageQuery, Users
+
+
+@pytest.fixture()
+def sqlite_session(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    test_session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(dish_query_basic, "SessionLocal", test_session)
+    monkeypatch.setattr(dish_query_filters, "SessionLocal", test_session)
+    monkeypatch.setattr(dish_query_iterations, "SessionLocal", test_session)
+
+    with test_session() as seed:
+        seed.add(Users(id=1, username="alice", hashed_password="x"))
+        seed.add(Users(id=2, username="bob", hashed_password="x"))
+        seed.flush()
+        for qid, user_id, day, position in (
+            (10, 1, 18, 1),
+            (11, 1, 18, 2),
+            (12, 1, 19, 1),
+            (20, 2, 18, 1),
+        ):
+            seed.add(
+                DishImageQuery(
+                    id=qid,
+                    user_id=user_id,
+                    image_url=f"/images/{qid}.jpg",
+                    result_gemini={"phase": 2, "blob": "x" * 1000},
+                    dish_position=position,
+                    created_at=datetime(2026, 4, day, 12, qid),
+                    target_date=datetime(2026, 4, day),
+                )
+            )
+        seed.commit()
+
+    yield test_session
+
+
+def _add_tied_rows(session_factory):
+    """Three more alice rows sharing one created_at, newer than the seed rows."""
+    tied_at = datetime(2026, 4, 20, 9, 0)
+    with session_factory() as seed:
+        for qid in (30, 31, 32):
+            seed.add(DishImageQuery(id=qid, user_id=1, created_at=tied_at))
+        seed.commit()
+
+
+def test_by_user_pages_newest_first_with_keyset_cursor(sqlite_session):
+    page1, cursor = dish_query_filters.get_dish_image_queries_by_user(1, limit=2)
+    assert [row.id for row in page1] == [12, 11]
+    assert cursor == (page1[-1].created_at, 11)
+
+    page2, cursor = dish_query_filters.get_dish_image_queries_by_user(1, limit=2, before=cursor)
+    assert [row.id for row in page2] == [10]
+    assert cursor is None  # short page => no more history
+
+
+def test_by_user_cursor_splits_tied_timestamps_without_skips(sqlite_session):
+    _add_tied_rows(sqlite_session)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = dish_query_filters.get_dish_image_queries_by_user(1, limit=2, before=cursor)
+        seen.append([row.id for row in page])
+        if cursor is None:
+            break
+
+    # The 32/31/30 tie straddles the first page boundary.
+    assert seen == [[32, 31], [30, 12], [11, 10], []]
+
+
+def test_summary_by_user_projects_only_list_columns(sqlite_session):
+    rows, cursor = dish_query_filters.get_dish_image_queries_by_user_summary(1)
+
+    assert cursor is None
+    assert [row.id for row in rows] == [12, 11, 10]  # newest first
+    assert set(rows[0]._fields) == {
+        "id",
+        "image_url",
+        "dish_position",
+        "created_at",
+        "target_date",
+    }
+    assert rows[0].image_url == "/images/12.jpg"
+
+
+def test_summary_by_user_pages_through_tied_timestamps(sqlite_session):
+    _add_tied_rows(sqlite_session)
+
+    page1, cursor = dish_query_filters.get_dish_image_queries_by_user_summary(1, limit=2)
+    page2, cursor = dish_query_filters.get_dish_image_queries_by_user_summary(
+        1, limit=2, before=cursor
+    )
+
+    assert [row.id for row in page1] == [32, 31]
+    assert [row.id for row in page2] == [30, 12]
+    assert cursor == (page2[-1].created_at, 12)
+
+
+def test_summary_by_user_and_date_scopes_to_user_and_day(sqlite_session):
+    rows = dish_query_filters.get_dish_image_query_summaries_by_user_and_date(1, date(2026, 4, 18))
+
+    assert [(row.id, row.dish_position) for row in rows] == [(10, 1), (11, 2)]
+    assert "result_gemini" not in rows[0]._fields
+
+
+def test_update_metadata_converts_legacy_record_and_patches_current_iteration(sqlite_session):
+    assert dish_query_iterations.update_metadata(10, "Pho", "1 bowl", 2.0) is True
+
+    with sqlite_session() as db:
+        result = db.get(DishImageQuery, 10).result_gemini
+    metadata = result["iterations"][0]["metadata"]
+    assert metadata["selected_dish"] == "Pho"
+    assert metadata["number_of_servings"] == 2.0
+    assert metadata["metadata_modified"] is True
+    assert result["iterations"][0]["analysis"]["blob"] == "x" * 1000
+
+
+def test_update_metadata_missing_record_returns_false(sqlite_session):
+    assert dish_query_iterations.update_metadata(999, "Pho", "1 bowl", 1.0) is False
+
+
+def test_metadata_patch_statement_compiles_to_targeted_jsonb_set():
+    stmt = dish_query_iterations._metadata_patch_statement(7, 1, {"selected_dish": "Pho"})
+    compiled = stmt.compile(dialect=postgresql.dialect())
+
+    table = DishImageQuery.__tablename__
+    current = f"CAST({table}.result_gemini AS JSONB) #> %(param_1)s::TEXT[]"
+    # A stored JSON null (or a missing path) merges into {} instead of
+    # turning `null || {...}` into an array.
+    base = (
+        f"CASE WHEN (jsonb_typeof({current}) = %(jsonb_typeof_1)s::VARCHAR) "
+        f"THEN {current} ELSE %(param_2)s::JSONB END"
+    )
+    assert str(compiled) == (
+        f"UPDATE {table} SET result_gemini=jsonb_set(CAST({table}.result_gemini AS JSONB), "
+        f"%(param_1)s::TEXT[], {base} || %(param_3)s::JSONB) "
+        f"WHERE {table}.id = %(id_1)s::INTEGER"
+    )
+    assert compiled.params == {
+        "param_1": ["iterations", "1", "metadata"],
+        "jsonb_typeof_1": "object",
+        "param_2": {},
+        "param_3": {"selected_dish": "Pho"},
+        "id_1": 7,
+    }
+
+
+def test_replace_slot_atomic_swaps_slot_row_and_returns_old_urls(sqlite_session):
+    new_row, old_urls = dish_query_basic.replace_slot_atomic(
+        user_id=1,
+        target_date=datetime(2026, 4, 18),
+        dish_position=1,
+        image_url="/images/new.jpg",
+    )
+
+    assert old_urls == ["/images/10.jpg"]
+    # Loaded from INSERT ... RETURNING; usable after the session closed.
+    assert new_row.id is not None
+    assert new_row.image_url == "/images/new.jpg"
+    assert new_row.result_gemini is None
+
+    with sqlite_session() as db:
+        assert db.get(DishImageQuery, 10) is None
+        assert db.get(DishImageQuery, 11) is not None  # other slot untouched
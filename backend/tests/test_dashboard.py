@@ -0,0 +1,55 @@
+"""
+Endpoint tests for GET /api/dashboard/ — conditional-GET (ETag / 304) behavior.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+# pylint: disable=redefined-outer-name,unused-argument
+
+import pytest
+
+from src.api import dashboard
+
+
+@pytest.fixture()
+def patch_auth(monkeypatch, fake_user):
+    monkeypatch.setattr(dashboard, "authenticate_user_from_request", lambda _r: fake_user)
+
+
+@pytest.fixture()
+def calendar_counts(monkeypatch):
+    counts = {"2026-04-18": 2}
+    monkeypatch.setattr(dashboard, "get_calendar_data", lambda *_a: counts)
+    return counts
+
+
+def test_returns_401_when_not_authenticated(client, monkeypatch):
+    monkeypatch.setattr(dashboard, "authenticate_user_from_request", lambda _r: None)
+    res = client.get("/api/dashboard/?year=2026&month=4")
+    assert res.status_code == 401
+
+
+def test_response_carries_etag_and_private_cache_control(client, patch_auth, calendar_counts):
+    res = client.get("/api/dashboard/?year=2026&month=4")
+    assert res.status_code == 200
+    assert res.headers["etag"].startswith('"')
+    assert res.headers["cache-control"] == "private, no-cache"
+    assert res.json()["display_month"] == 4
+
+
+def test_matching_if_none_match_returns_304_with_empty_body(client, patch_auth, calendar_counts):
+    first = client.get("/api/dashboard/?year=2026&month=4")
+    etag = first.headers["etag"]
+
+    second = client.get("/api/dashboard/?year=2026&month=4", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_new_upload_changes_etag(client, patch_auth, calendar_counts):
+    etag = client.get("/api/dashboard/?year=2026&month=4").headers["etag"]
+    calendar_counts["2026-04-19"] = 1
+
+    res = client.get("/api/dashboard/?year=2026&month=4", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["etag"] != etag
@@ -16,7 +16,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from src.service.llm import fast_caption
+from src.service.llm import _analyzer_shared, fast_caption
 
 
 @pytest.fixture()
@@ -36,7 +36,7 @@ def _patch_client(monkeypatch, *, returns=None, raises=None):
 
         return SimpleNamespace(models=_Models())
 
-    monkeypatch.setattr(fast_caption.genai, "Client", _factory)
+    monkeypatch.setattr(_analyzer_shared.genai, "Client", _factory)
 
 
 def test_generate_fast_caption_async_returns_plain_text(monkeypatch, dummy_image):
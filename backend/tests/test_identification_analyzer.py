@@ -15,7 +15,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from src.service.llm import identification_analyzer
+from src.service.llm import _analyzer_shared, identification_analyzer
 
 
 @pytest.fixture()
@@ -51,7 +51,7 @@ def _patch_client(monkeypatch, *, captured: dict, response=None):
 
         return SimpleNamespace(models=_Models())
 
-    monkeypatch.setattr(identification_analyzer.genai, "Client", _factory)
+    monkeypatch.setattr(_analyzer_shared.genai, "Client", _factory)
 
 
 def test_analyze_component_identification_sends_single_image_when_no_reference_bytes(monkeypatch, dummy_image):
@@ -0,0 +1,46 @@
+"""
+Tests for src/api/_json_response.py — FastJSONResponse must produce the
+same body as Starlette's stdlib-json JSONResponse, and valid JSON where
+the two differ.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import json
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from src.api._json_response import FastJSONResponse
+
+
+def test_body_matches_stdlib_json_response():
+    payload = {
+        "dish_name": "Phở bò",
+        "healthiness_score": 7,
+        "calories_kcal": 512.5,
+        "micronutrients": [{"name": "Iron", "amount": 2.1}],
+        "target_date": None,
+        "confirmed": True,
+    }
+
+    assert FastJSONResponse(content=payload).body == JSONResponse(content=payload).body
+
+
+def test_extreme_floats_decode_to_the_same_values():
+    payload = {"values": [1e300, -1e300, 1e-300, 5e-324, 1.5e16, 0.1, 123456789.123]}
+
+    body = FastJSONResponse(content=payload).body
+
+    assert json.loads(body) == json.loads(JSONResponse(content=payload).body) == payload
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_floats_render_as_null(value):
+    with pytest.raises(ValueError):
+        JSONResponse(content={"calories_kcal": value})
+
+    body = FastJSONResponse(content={"calories_kcal": value}).body
+
+    assert body == b'{"calories_kcal":null}'
+    assert json.loads(body) == {"calories_kcal": None}
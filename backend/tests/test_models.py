@@ -0,0 +1,35 @@
+"""
+Tests for the shared row -> dict helper in src/models.py.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring,protected-access
+
+from types import SimpleNamespace
+
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+from src import models
+
+
+def test_row_to_dict_maps_every_column():
+    user = models.Users(id=1, username="alice", hashed_password="x", role=None)
+
+    assert models._row_to_dict(user) == {
+        "id": 1,
+        "username": "alice",
+        "hashed_password": "x",
+        "role": None,
+    }
+
+
+def test_row_to_dict_handles_single_column_tables():
+    table = Table("one_column", MetaData(), Column("name", String))
+    row = SimpleNamespace(__table__=table, name="Pho")
+
+    assert models._row_to_dict(row) == {"name": "Pho"}
+
+
+def test_row_to_dict_single_integer_column_is_not_iterated():
+    table = Table("one_int", MetaData(), Column("id", Integer))
+
+    assert models._row_to_dict(SimpleNamespace(__table__=table, id=7)) == {"id": 7}
@@ -15,7 +15,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from src.service.llm import nutrition_analyzer
+from src.service.llm import _analyzer_shared, nutrition_analyzer
 
 
 NUTRITION_OK_RESPONSE_DICT = {
@@ -70,7 +70,7 @@ def _patch_client(monkeypatch, *, captured: dict, response=None):
 
         return SimpleNamespace(models=_Models())
 
-    monkeypatch.setattr(nutrition_analyzer.genai, "Client", _factory)
+    monkeypatch.setattr(_analyzer_shared.genai, "Client", _factory)
 
 
 def test_analyze_nutritional_analysis_sends_single_image_when_no_reference_bytes(monkeypatch, dummy_image):
@@ -0,0 +1,40 @@
+"""
+Tests for src/service/llm/pricing.py — model-key normalization and the
+per-call USD price.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from src.service.llm.pricing import compute_price_usd, normalize_model_key
+
+
+@pytest.mark.parametrize(
+    "model,vendor,expected",
+    [
+        ("gemini-2.5-pro", "gemini", "gemini-2.5-pro"),
+        (" Gemini-2.5-Flash ", "gemini", "gemini-2.5-flash"),
+        ("gemini-2.5-pro-002", "gemini", "gemini-2.5-pro"),
+        ("gemini-2.0-flash", "gemini", "gemini-2.5"),
+        (None, "gemini", "gemini-2.5"),
+        ("gpt-5-mini-2025-08-07", "openai", "gpt-5-low"),
+        ("gpt-5-high", "openai", "gpt-5-high"),
+        ("gpt-4o", "openai", "gpt-5"),
+    ],
+)
+def test_normalize_model_key(model, vendor, expected):
+    assert normalize_model_key(model, vendor) == expected
+
+
+def test_compute_price_usd_uses_per_million_rates():
+    # 1M in @ 1.25 + 200k out @ 10.00
+    assert compute_price_usd("gemini-2.5-pro", "gemini", 1_000_000, 200_000) == 3.25
+    # cached input only priced where the table has a cached rate
+    assert compute_price_usd("gpt-5", "openai", 0, 0, cached_input_tokens=1_000_000) == 0.125
+    assert compute_price_usd("gemini-2.5-pro", "gemini", 0, 0, cached_input_tokens=10**6) == 0.0
+
+
+def test_compute_price_usd_falls_back_to_default_pricing():
+    # "gemini-2.0-flash" normalizes to "gemini-2.5", which has no table entry
+    assert compute_price_usd("gemini-2.0-flash", "gemini", 1_000_000, 1_000_000) == 0.375
@@ -10,6 +10,7 @@ step1_data is non-empty) or strips the placeholder line entirely.
 # pylint: disable=missing-class-docstring,missing-function-docstring
 # pylint: disable=redefined-outer-name,unused-argument
 
+from src.service.llm import prompts
 from src.service.llm.prompts import (
     get_component_identification_prompt,
     get_nutritional_analysis_prompt,
@@ -259,3 +260,13 @@ def test_step2_prompt_null_corrected_nutrition_data_renders_as_null():
         "Chicken Rice", _SAMPLE_COMPONENTS, personalized_matches=matches
     )
     assert '"corrected_nutrition_data": null' in prompt
+
+
+def test_prompt_files_are_read_once_per_process():
+    get_component_identification_prompt()
+    before = prompts._load_prompt.cache_info()  # pylint: disable=protected-access
+    get_component_identification_prompt(reference={"prior_identification_data": _FULL_PRIOR})
+    after = prompts._load_prompt.cache_info()  # pylint: disable=protected-access
+
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
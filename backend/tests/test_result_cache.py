@@ -0,0 +1,106 @@
+"""
+Tests for src/service/llm/_result_cache.py and its use by the Component
+Identification analyzer.
+"""
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+# pylint: disable=redefined-outer-name,unused-argument
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.service.llm import _analyzer_shared, _result_cache, identification_analyzer
+
+
+@pytest.fixture()
+def jpeg(tmp_path):
+    path = tmp_path / "dish.jpg"
+    path.write_bytes(b"jpeg-v1")
+    return path
+
+
+def test_key_tracks_image_contents_and_inputs(jpeg, tmp_path):
+    key = _result_cache.result_cache_key(jpeg, "prompt", "model", None)
+    copy_path = tmp_path / "same-bytes.jpg"
+    copy_path.write_bytes(b"jpeg-v1")
+
+    assert _result_cache.result_cache_key(copy_path, "prompt", "model", None) == key
+    assert _result_cache.result_cache_key(jpeg, "prompt 2", "model", None) != key
+    assert _result_cache.result_cache_key(jpeg, "prompt", "model", b"ref") != key
+
+    jpeg.write_bytes(b"jpeg-v2-rewritten")
+    assert _result_cache.result_cache_key(jpeg, "prompt", "model", None) != key
+
+
+def test_cached_results_are_copies_and_expire(monkeypatch):
+    _result_cache.put_cached_result("k", {"components": ["rice"]})
+
+    hit = _result_cache.get_cached_result("k")
+    hit["components"].append("egg")
+    assert _result_cache.get_cached_result("k") == {"components": ["rice"]}
+
+    monkeypatch.setattr(_result_cache, "RESULT_CACHE_TTL_S", -1)
+    assert _result_cache.get_cached_result("k") is None
+
+
+def test_cache_hit_zeroes_billing_and_retimes(monkeypatch):
+    monkeypatch.setattr(_result_cache.time, "time", lambda: 100.5)
+    cached = {
+        "components": [],
+        "input_token": 900,
+        "output_token": 50,
+        "price_usd": 0.01,
+        "analysis_time": 12.0,
+    }
+
+    hit = _result_cache.as_cache_hit(cached, analysis_start_time=100.0)
+
+    assert hit == {
+        "components": [],
+        "input_token": 0,
+        "output_token": 0,
+        "price_usd": 0.0,
+        "analysis_time": 0.5,
+        "cache_hit": True,
+    }
+
+
+def test_identical_identification_request_skips_gemini(monkeypatch, jpeg):
+    calls = []
+    response = SimpleNamespace(
+        parsed=None,
+        text='{"dish_predictions": [], "components": []}',
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=1, candidates_token_count=1, thoughts_token_count=0
+        ),
+    )
+
+    def _factory(api_key):
+        def generate_content(**_kwargs):
+            calls.append(1)
+            return response
+
+        return SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+
+    monkeypatch.setattr(_analyzer_shared.genai, "Client", _factory)
+
+    def _run(prompt):
+        return asyncio.run(
+            identification_analyzer.analyze_component_identification_async(
+                image_path=jpeg, analysis_prompt=prompt
+            )
+        )
+
+    first = _run("PROMPT")
+    second = _run("PROMPT")
+    assert len(calls) == 1
+    assert "cache_hit" not in first and first["input_token"] == 1
+    assert second["cache_hit"] is True
+    assert second["input_token"] == second["output_token"] == 0
+    assert second["price_usd"] == 0.0
+    assert second["components"] == first["components"]
+
+    _run("DIFFERENT PROMPT")
+    assert len(calls) == 2
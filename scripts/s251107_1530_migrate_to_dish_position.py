@@ -26,43 +26,67 @@ def migrate_to_dish_position():
 
     Steps:
     1. Add dish_position column
-    2. Migrate existing data (optional - map meal types to positions)
+    2. Backfill dish_position from meal_type (breakfast/lunch/dinner/snack -> 1-4),
+       newest row per (user, day, slot) only
     3. Drop meal_type column
     """
 
-    with engine.connect() as conn:
-        print("Starting migration to dish_position...")
+    print("Starting migration to dish_position...")
 
-        # Step 1: Add dish_position column (nullable)
+    # One transaction: a failure at any step rolls back the whole migration,
+    # and the table's ACCESS EXCLUSIVE lock is taken once.
+    with engine.begin() as conn:
         print("Adding dish_position column...")
-        try:
-            conn.execute(text(
-                "ALTER TABLE dish_image_query_prod "
-                "ADD COLUMN dish_position INTEGER NULL"
-            ))
-            conn.commit()
-            print("✓ Added dish_position column")
-        except Exception as e:
-            if "already exists" in str(e):
-                print("✓ dish_position column already exists")
-            else:
-                raise
+        conn.execute(text(
+            "ALTER TABLE dish_image_query_prod "
+            "ADD COLUMN IF NOT EXISTS dish_position INTEGER NULL"
+        ))
+
+        # Re-runs after the drop have no meal_type left to backfill from.
+        has_meal_type = conn.execute(text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'dish_image_query_prod' AND column_name = 'meal_type'"
+        )).first() is not None
+        if has_meal_type:
+            # Set-based: one pass over the table instead of per-row updates.
+            # (user_id, target_date::date, dish_position) is unique, so only
+            # the newest row per mapped slot gets a position; older duplicates
+            # (e.g. two lunches on one day) and slots already taken keep NULL.
+            print("Backfilling dish_position from meal_type...")
+            backfilled = conn.execute(text(
+                "UPDATE dish_image_query_prod AS d SET dish_position = ranked.position "
+                "FROM ("
+                "  SELECT id, target_date, position, ROW_NUMBER() OVER ("
+                "    PARTITION BY user_id, target_date::date, position "
+                "    ORDER BY created_at DESC, id DESC) AS rn "
+                "  FROM ("
+                "    SELECT id, user_id, target_date, created_at, CASE meal_type "
+                "    WHEN 'breakfast' THEN 1 WHEN 'lunch' THEN 2 "
+                "    WHEN 'dinner' THEN 3 WHEN 'snack' THEN 4 ELSE 5 END AS position "
+                "    FROM dish_image_query_prod "
+                "    WHERE meal_type IS NOT NULL AND dish_position IS NULL"
+                "  ) AS mapped"
+                ") AS ranked "
+                "WHERE d.id = ranked.id "
+                "AND (ranked.target_date IS NULL OR ranked.rn = 1) "
+                "AND NOT EXISTS ("
+                "  SELECT 1 FROM dish_image_query_prod AS taken "
+                "  WHERE taken.user_id = d.user_id "
+                "  AND taken.target_date::date = d.target_date::date "
+                "  AND taken.dish_position = ranked.position)"
+            )).rowcount
+            print(f"✓ Backfilled dish_position on {backfilled} rows")
 
-        # Step 2: Drop meal_type column (if exists)
         print("Dropping meal_type column...")
-        try:
-            conn.execute(text(
-                "ALTER TABLE dish_image_query_prod "
-                "DROP COLUMN IF EXISTS meal_type"
-            ))
-            conn.commit()
-            print("✓ Dropped meal_type column")
-        except Exception as e:
-            print(f"Warning: Could not drop meal_type column: {e}")
+        conn.execute(text(
+            "ALTER TABLE dish_image_query_prod "
+            "DROP COLUMN IF EXISTS meal_type"
+        ))
 
-        print("\n✓ Migration completed successfully!")
-        print("Note: Existing records will have dish_position = NULL")
-        print("New uploads will use dish_position 1-5")
+    print("\n✓ Migration completed successfully!")
+    print("Note: Records without a meal_type, and older duplicates of a day's slot,")
+    print("keep dish_position = NULL")
+    print("New uploads will use dish_position 1-5")
 
 
 if __name__ == "__main__":